@@ -0,0 +1,99 @@
+"""Tests for the data processing helpers."""
+
+import pandas as pd
+
+from utils import calculate_rolling_metrics, get_monthly_aggregation
+from utils.config import BALANCE_SHEET_CONFIG
+from utils.data_processing import _calculate_vehicle_summary_metrics
+from utils.etl.data_loader import _clean_and_process_data
+
+
+def _loaded_balance_sheet():
+    """Build a multi-asset Balance Sheet frame the way the data loader does."""
+    rows = [
+        {
+            "Platform": platform,
+            "Asset": asset,
+            "Value": f"£{value:,}",
+            "Timestamp": f"{day:02d}/{month:02d}/2024",
+        }
+        for month in range(1, 7)
+        for day, (platform, asset, value) in enumerate(
+            [("P1", "Fund A", 1000 * month), ("P1", "Fund B", 500), ("P2", "ISA", 250)],
+            start=10,
+        )
+    ]
+    return _clean_and_process_data(pd.DataFrame(rows), BALANCE_SHEET_CONFIG)
+
+
+def test_rolling_metrics_aggregate_loaded_frame_by_month():
+    df = _loaded_balance_sheet()
+    assert "Month" in df.columns
+
+    result = calculate_rolling_metrics(df, window=3)
+
+    assert len(result) == 6
+    assert result["Month"].is_unique
+    assert result["Value"].tolist() == [1000.0 * month + 750.0 for month in range(1, 7)]
+    assert result["Rolling_3M_Avg"].iloc[2] == 2750.0
+
+
+def test_rolling_metrics_keep_monthly_frame():
+    monthly = pd.DataFrame(
+        {
+            "Month": pd.date_range("2024-01-01", periods=4, freq="MS"),
+            "Value": [1.0, 2.0, 3.0, 4.0],
+        }
+    )
+
+    result = calculate_rolling_metrics(monthly, window=2)
+
+    assert result["Month"].tolist() == monthly["Month"].tolist()
+    assert result["Rolling_2M_Avg"].tolist()[1:] == [1.5, 2.5, 3.5]
+
+
+def test_rolling_metrics_aggregate_repeated_period_months():
+    df = pd.DataFrame(
+        {
+            "Month": pd.PeriodIndex(
+                ["2024-01", "2024-01", "2024-02", "2024-03"], freq="M"
+            ),
+            "Value": [1.0, 2.0, 4.0, 5.0],
+        }
+    )
+
+    result = calculate_rolling_metrics(df, window=2)
+
+    assert result["Month"].tolist() == list(
+        pd.date_range("2024-01-01", periods=3, freq="MS")
+    )
+    assert result["Value"].tolist() == [3.0, 4.0, 5.0]
+
+
+def test_monthly_aggregation_derives_month_from_timestamp():
+    df = _loaded_balance_sheet()
+    df = df.assign(Month=df["Timestamp"].dt.to_period("M"))
+
+    result = get_monthly_aggregation(df, ["Platform"])
+
+    assert pd.api.types.is_datetime64_dtype(result["Month"])
+    assert len(result) == 12
+
+
+def test_vehicle_summary_ytd_mileage_follows_requested_year():
+    car_assets = pd.DataFrame(
+        {
+            "Timestamp": pd.to_datetime(["2023-01-15", "2023-12-15", "2024-06-15"]),
+            "Asset": pd.Categorical(["Car"] * 3),
+            "Car_Value": [10000.0, 9000.0, 8000.0],
+            "Loan_Balance": [0.0, 0.0, 0.0],
+            "Loan_Status": pd.Categorical(["Owned"] * 3),
+            "Mileage": [1000.0, 9000.0, 15000.0],
+        }
+    )
+
+    ytd_2023 = _calculate_vehicle_summary_metrics(car_assets, 2023)["ytd_mileage"]
+    ytd_2024 = _calculate_vehicle_summary_metrics(car_assets, 2024)["ytd_mileage"]
+
+    assert ytd_2023 == 14000.0
+    assert ytd_2024 == 0.0
@@ -33,13 +33,16 @@ from .config import (
 from .data_processing import (
     calculate_actual_mom_changes,
     calculate_actual_pension_returns,
+    calculate_all_asset_type_metrics,
     calculate_allocation_metrics,
     calculate_asset_type_metrics,
     calculate_car_equity,
     calculate_car_monthly_costs,
     calculate_rolling_metrics,
+    calculate_summary_statistics,
     calculate_vehicle_metrics,
     calculate_vehicle_summary_metrics,
+    compute_all_time_periods,
     create_allocation_time_series,
     create_platform_allocation_time_series,
     create_platform_trends_data,
@@ -174,12 +177,15 @@ from .design.tokens import (
 )
 from .etl.asset_classifier import classify_asset_types
 from .etl.data_loader import (
+    LoadedData,
     filter_data_by_date_range,
+    filter_mask_by_date_range,
     get_month_range,
     load_car_assets,
     load_car_expenses,
     load_car_payments,
     load_data,
+    load_data_with_month_range,
     load_pension_cashflows,
 )
 
@@ -214,8 +220,11 @@ __all__ = [
     "CASHFLOW_TYPES",
     # ETL functions (core data loading and transformation)
     "load_data",
+    "load_data_with_month_range",
+    "LoadedData",
     "load_pension_cashflows",
     "filter_data_by_date_range",
+    "filter_mask_by_date_range",
     "get_month_range",
     "classify_asset_types",
     # Data processing functions
@@ -224,10 +233,13 @@ __all__ = [
     "get_monthly_aggregation",
     "calculate_rolling_metrics",
     "get_asset_breakdown",
+    "calculate_all_asset_type_metrics",
     "calculate_asset_type_metrics",
     "calculate_allocation_metrics",
+    "calculate_summary_statistics",
     "create_allocation_time_series",
     "get_asset_type_time_periods",
+    "compute_all_time_periods",
     "create_platform_trends_data",
     "create_platform_allocation_time_series",
     # Pension cashflow analytics
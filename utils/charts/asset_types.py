@@ -245,11 +245,15 @@ def create_asset_type_breakdown(df, asset_type):
         return platform_fig, asset_fig
 
     # Platform breakdown
-    platform_breakdown = latest_data.groupby("Platform")["Value"].sum().reset_index()
+    platform_breakdown = (
+        latest_data.groupby("Platform", observed=True)["Value"].sum().reset_index()
+    )
 
     # Asset breakdown (if Asset column exists)
     if "Asset" in latest_data.columns:
-        asset_breakdown = latest_data.groupby("Asset")["Value"].sum().reset_index()
+        asset_breakdown = (
+            latest_data.groupby("Asset", observed=True)["Value"].sum().reset_index()
+        )
     else:
         asset_breakdown = pd.DataFrame()
 
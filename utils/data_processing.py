@@ -5,6 +5,7 @@ from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
+import streamlit as st
 
 from .config import (
     ASSET_TYPES,
@@ -12,6 +13,27 @@ from .config import (
     DEFAULT_ROLLING_WINDOW,
 )
 
+# Column to break the latest month down by, keyed by breakdown type
+_BREAKDOWN_COLUMNS = {
+    "platform": "Platform",
+    "asset_type": "Asset_Type",
+    "asset": "Asset",
+}
+
+# Metrics reported for an asset type with no data
+_EMPTY_ASSET_TYPE_METRICS = {
+    "latest_value": 0.0,
+    "mom_change": None,
+    "ytd_change": None,
+    "platforms": 0,
+    "assets": 0,
+    "months_tracked": 0,
+    "avg_monthly_value": 0.0,
+    "max_value": 0.0,
+    "min_value": 0.0,
+    "volatility": 0.0,
+}
+
 
 def filter_by_asset_type(df: pd.DataFrame, asset_type: str) -> pd.DataFrame:
     """
@@ -27,7 +49,75 @@ def filter_by_asset_type(df: pd.DataFrame, asset_type: str) -> pd.DataFrame:
     if df is None or df.empty:
         return pd.DataFrame()
 
-    return df[df["Asset_Type"] == asset_type].copy()
+    return df[df["Asset_Type"] == asset_type]
+
+
+def _has_month_key(df: pd.DataFrame) -> bool:
+    """
+    Check whether the DataFrame's 'Month' column can be used as its month key.
+
+    The column is reused when it holds month-start timestamps (as attached by
+    the data loader) or when there is no 'Timestamp' column to derive it from.
+    It does not tell raw rows from monthly aggregates: loaded frames carry
+    'Month' on every row.
+
+    Args:
+        df: Input DataFrame
+
+    Returns:
+        True if 'Month' is present and usable as the month key
+    """
+    if "Month" not in df.columns:
+        return False
+
+    return "Timestamp" not in df.columns or pd.api.types.is_datetime64_dtype(
+        df["Month"]
+    )
+
+
+def _month_key(df: pd.DataFrame) -> pd.Series:
+    """
+    Get the month (as month-start timestamps) of each row.
+
+    Uses the 'Month' column attached by the data loader when it is usable (see
+    ``_has_month_key``); otherwise truncates 'Timestamp' with a numpy
+    datetime64[M] cast, so grouping and comparisons stay on int64 values.
+
+    Args:
+        df: Input DataFrame with 'Month' or 'Timestamp' column
+
+    Returns:
+        Series named 'Month', aligned with the DataFrame's index
+    """
+    if _has_month_key(df):
+        return df["Month"]
+
+    timestamps = df["Timestamp"]
+    if not pd.api.types.is_datetime64_any_dtype(timestamps):
+        timestamps = pd.to_datetime(timestamps)
+
+    months = timestamps.values.astype("datetime64[M]")
+    return pd.Series(months.astype("datetime64[ns]"), index=df.index, name="Month")
+
+
+def _with_month(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return the DataFrame with a 'Month' column of month-start timestamps.
+
+    Frames produced by the data loader already carry 'Month' and are returned
+    unchanged; otherwise the column is derived (or replaced) from 'Timestamp' on
+    a new frame, so the input is never mutated.
+
+    Args:
+        df: Input DataFrame with 'Timestamp' column
+
+    Returns:
+        DataFrame with a 'Month' column of month-start timestamps
+    """
+    if _has_month_key(df):
+        return df
+
+    return df.assign(Month=_month_key(df))
 
 
 def get_latest_month_data(df: pd.DataFrame) -> pd.DataFrame:
@@ -38,16 +128,14 @@ def get_latest_month_data(df: pd.DataFrame) -> pd.DataFrame:
         df: Input DataFrame with 'Timestamp' column
 
     Returns:
-        DataFrame containing only the latest month's data
+        DataFrame containing only the latest month's rows (no columns are added)
     """
     if df is None or df.empty:
         return pd.DataFrame()
 
-    df_copy = df.copy()
-    df_copy["Month"] = df_copy["Timestamp"].dt.to_period("M")
-    latest_month = df_copy["Month"].max()
+    months = _month_key(df)
 
-    return df_copy[df_copy["Month"] == latest_month]
+    return df.loc[months == months.max()]
 
 
 def get_monthly_aggregation(
@@ -69,26 +157,63 @@ def get_monthly_aggregation(
     if df is None or df.empty:
         return pd.DataFrame()
 
-    df_copy = df.copy()
-    df_copy["Month"] = df_copy["Timestamp"].dt.to_period("M")
-
-    # Ensure value column is numeric
-    df_copy[value_col] = pd.to_numeric(df_copy[value_col], errors="coerce")
+    # Ensure value column is numeric (currency columns are already float64 on load)
+    values = df[value_col]
+    if not pd.api.types.is_numeric_dtype(values):
+        values = pd.to_numeric(values, errors="coerce")
 
-    # Define grouping columns
-    group_cols = ["Month"]
+    # Define grouping keys (the month key is not added to the frame)
+    group_keys = [_month_key(df)]
     if group_by_cols:
-        group_cols.extend(group_by_cols)
+        group_keys.extend(df[col] for col in group_by_cols)
 
     # Aggregate
-    aggregated = df_copy.groupby(group_cols)[value_col].sum().reset_index()
-
-    # Convert Period to timestamp for JSON serialization
-    aggregated["Month"] = aggregated["Month"].dt.to_timestamp()
+    aggregated = values.groupby(group_keys, observed=True).sum().reset_index()
 
     return aggregated
 
 
+def _ytd_start_position(months: pd.DatetimeIndex) -> int:
+    """
+    Find the position of the first month in the latest month's year.
+
+    Args:
+        months: Sorted month-start timestamps
+
+    Returns:
+        Index into ``months`` of the year-to-date start month
+    """
+    year_start = pd.Timestamp(year=months[-1].year, month=1, day=1)
+    return int(months.searchsorted(year_start, side="left"))
+
+
+def _rolling_mean_std(values: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute trailing rolling mean and sample standard deviation in one pass.
+
+    Both statistics are taken over the same strided window view, so the values are
+    traversed once rather than once per statistic. Positions without a full window
+    are NaN, matching ``Series.rolling(window)``.
+
+    Args:
+        values: 1-D array of values ordered in time
+        window: Number of observations in each window
+
+    Returns:
+        Tuple of (rolling mean, rolling standard deviation) arrays
+    """
+    rolling_mean = np.full(len(values), np.nan)
+    rolling_std = np.full(len(values), np.nan)
+
+    if len(values) >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(values, window)
+        rolling_mean[window - 1 :] = windows.mean(axis=1)
+        if window > 1:
+            rolling_std[window - 1 :] = windows.std(axis=1, ddof=1)
+
+    return rolling_mean, rolling_std
+
+
 def calculate_rolling_metrics(
     df: pd.DataFrame, window: int = DEFAULT_ROLLING_WINDOW, value_col: str = "Value"
 ) -> pd.DataFrame:
@@ -106,32 +231,82 @@ def calculate_rolling_metrics(
     if df is None or df.empty:
         return pd.DataFrame()
 
-    df_copy = df.copy()
+    # Ensure we have monthly data (loaded frames carry 'Month' on every row, so
+    # raw data is recognised by its timestamps or repeated months)
+    if "Timestamp" in df.columns or not df["Month"].is_unique:
+        df = _with_month(df).groupby("Month", observed=True)[value_col].sum()
+        df = df.reset_index()
+    if isinstance(df["Month"].dtype, pd.PeriodDtype):
+        # Convert Period to timestamp for JSON serialization
+        df = df.assign(Month=df["Month"].dt.to_timestamp())
 
-    # Ensure we have monthly data
-    if "Month" not in df_copy.columns:
-        df_copy["Month"] = df_copy["Timestamp"].dt.to_period("M")
-        df_copy = df_copy.groupby("Month")[value_col].sum().reset_index()
+    # Sort by month to ensure proper rolling calculation (groupby output already is)
+    if not df["Month"].is_monotonic_increasing:
+        df = df.sort_values("Month")
 
-    # Convert Period to timestamp for JSON serialization
-    if df_copy["Month"].dtype == "object" or hasattr(df_copy["Month"].iloc[0], "freq"):
-        df_copy["Month"] = df_copy["Month"].dt.to_timestamp()
+    # Calculate rolling metrics
+    rolling_avg, rolling_std = _rolling_mean_std(
+        df[value_col].to_numpy(dtype=float), window
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rolling_volatility = rolling_std / rolling_avg
+
+    return df.assign(
+        **{
+            f"Rolling_{window}M_Avg": rolling_avg,
+            f"Rolling_{window}M_Std": rolling_std,
+            f"Rolling_{window}M_Volatility": rolling_volatility,
+        }
+    )
 
-    # Sort by month to ensure proper rolling calculation
-    df_copy = df_copy.sort_values("Month")
 
-    # Calculate rolling metrics
-    df_copy[f"Rolling_{window}M_Avg"] = df_copy[value_col].rolling(window=window).mean()
-    df_copy[f"Rolling_{window}M_Std"] = df_copy[value_col].rolling(window=window).std()
-    df_copy[f"Rolling_{window}M_Volatility"] = (
-        df_copy[f"Rolling_{window}M_Std"] / df_copy[f"Rolling_{window}M_Avg"]
+def _sum_by_label(
+    df: pd.DataFrame, label_col: str, value_col: str = "Value"
+) -> pd.DataFrame:
+    """
+    Sum values per label, equivalent to ``df.groupby(label_col).sum()``.
+
+    Categorical labels are summed with ``np.bincount`` over the category codes,
+    which avoids building a hash table for the small latest-month slices used by
+    breakdowns. Other dtypes fall back to groupby.
+
+    Args:
+        df: Input DataFrame with the label and value columns
+        label_col: Column to group by
+        value_col: Column to sum
+
+    Returns:
+        DataFrame with one row per observed label and its summed value
+    """
+    labels = df[label_col]
+    if not isinstance(labels.dtype, pd.CategoricalDtype):
+        return df.groupby(label_col, observed=True)[value_col].sum().reset_index()
+
+    codes = labels.cat.codes.to_numpy()
+    values = df[value_col].fillna(0).to_numpy(dtype=float)
+    has_label = codes >= 0
+    n_categories = len(labels.cat.categories)
+
+    totals = np.bincount(
+        codes[has_label], weights=values[has_label], minlength=n_categories
     )
+    observed = np.bincount(codes[has_label], minlength=n_categories) > 0
 
-    return df_copy
+    return pd.DataFrame(
+        {
+            label_col: pd.Categorical.from_codes(
+                np.flatnonzero(observed), dtype=labels.dtype
+            ),
+            value_col: totals[observed],
+        }
+    )
 
 
+@st.cache_data
 def get_asset_breakdown(
-    df: pd.DataFrame, breakdown_type: str = "platform"
+    df: pd.DataFrame,
+    breakdown_type: str = "platform",
+    latest_month: Optional[pd.Timestamp] = None,
 ) -> pd.DataFrame:
     """
     Get asset breakdown by platform or asset type.
@@ -139,6 +314,8 @@ def get_asset_breakdown(
     Args:
         df: Input DataFrame
         breakdown_type: Type of breakdown ('platform', 'asset_type', 'asset')
+        latest_month: Month to break down, if already known by the caller
+            (default: the most recent month in ``df``)
 
     Returns:
         DataFrame with breakdown data
@@ -146,133 +323,134 @@ def get_asset_breakdown(
     if df is None or df.empty:
         return pd.DataFrame()
 
-    df_copy = df.copy()
-
-    if breakdown_type == "platform":
-        breakdown_col = "Platform"
-    elif breakdown_type == "asset_type":
-        breakdown_col = "Asset_Type"
-    elif breakdown_type == "asset":
-        breakdown_col = "Asset"
-    else:
+    breakdown_col = _BREAKDOWN_COLUMNS.get(breakdown_type)
+    if breakdown_col is None:
         raise ValueError(f"Unknown breakdown_type: {breakdown_type}")
 
-    if breakdown_col not in df_copy.columns:
+    if breakdown_col not in df.columns:
         return pd.DataFrame()
 
-    # Get latest month data for current breakdown
-    latest_data = get_latest_month_data(df_copy)
+    # Get latest month data for current breakdown (only the columns needed)
+    if latest_month is None:
+        latest_data = get_latest_month_data(df)[[breakdown_col, "Value"]]
+    else:
+        latest_data = df.loc[_month_key(df) == latest_month, [breakdown_col, "Value"]]
 
     if latest_data.empty:
         return pd.DataFrame()
 
-    # Calculate breakdown
-    breakdown = latest_data.groupby(breakdown_col)["Value"].sum().reset_index()
+    # Calculate breakdown; a single group needs no grouping
+    labels = latest_data[breakdown_col]
+    if labels.notna().all() and labels.nunique() == 1:
+        breakdown = latest_data.iloc[:1].assign(Value=latest_data["Value"].sum())
+        breakdown = breakdown.reset_index(drop=True)
+    else:
+        breakdown = _sum_by_label(latest_data, breakdown_col)
     breakdown["Percentage"] = (breakdown["Value"] / breakdown["Value"].sum()) * 100
 
     return breakdown.sort_values("Value", ascending=False)
 
 
-def calculate_asset_type_metrics(
-    df: pd.DataFrame, asset_type: str
+def _summarize_monthly_values(
+    monthly_values: pd.Series, latest_counts: pd.Series
 ) -> Dict[str, Union[float, int, str, None]]:
     """
-    Calculate comprehensive metrics for a specific asset type.
+    Build the asset type metrics from one asset type's monthly totals.
 
     Args:
-        df: Input DataFrame with 'Asset_Type', 'Timestamp', 'Value', 'Platform', 'Asset' columns
-        asset_type: Asset type to calculate metrics for (e.g., 'Cash', 'Investments', 'Pensions')
+        monthly_values: Total value per month, indexed by month (sorted)
+        latest_counts: Distinct 'Platform' and 'Asset' counts in the latest month
 
     Returns:
         Dictionary containing asset type metrics
     """
-    if df is None or df.empty:
-        return {
-            "latest_value": 0.0,
-            "mom_change": None,
-            "ytd_change": None,
-            "platforms": 0,
-            "assets": 0,
-            "months_tracked": 0,
-            "avg_monthly_value": 0.0,
-            "max_value": 0.0,
-            "min_value": 0.0,
-            "volatility": 0.0,
-        }
-
-    # Filter data for the specific asset type
-    asset_df = filter_by_asset_type(df, asset_type)
-
-    if asset_df.empty:
-        return {
-            "latest_value": 0.0,
-            "mom_change": None,
-            "ytd_change": None,
-            "platforms": 0,
-            "assets": 0,
-            "months_tracked": 0,
-            "avg_monthly_value": 0.0,
-            "max_value": 0.0,
-            "min_value": 0.0,
-            "volatility": 0.0,
-        }
-
-    # Ensure timestamp is datetime
-    asset_df["Timestamp"] = pd.to_datetime(asset_df["Timestamp"])
-    asset_df["Month"] = asset_df["Timestamp"].dt.to_period("M")
-
-    # Get latest month data
-    latest_month = asset_df["Month"].max()
-    latest_data = asset_df[asset_df["Month"] == latest_month]
-    latest_value = latest_data["Value"].sum()
+    months = monthly_values.index
+    latest_value = monthly_values.iloc[-1]
 
     # Calculate MoM change
-    previous_month = asset_df[asset_df["Month"] < latest_month]["Month"].max()
     mom_change = None
-    if pd.notna(previous_month):
-        previous_data = asset_df[asset_df["Month"] == previous_month]
-        previous_value = previous_data["Value"].sum()
+    if len(monthly_values) > 1:
+        previous_value = monthly_values.iloc[-2]
         if previous_value > 0:
             mom_change = ((latest_value - previous_value) / previous_value) * 100
 
     # Calculate YTD change
-    current_year = latest_month.year
-    ytd_start_month = asset_df[asset_df["Month"].dt.year == current_year]["Month"].min()
+    ytd_start_value = monthly_values.iloc[_ytd_start_position(months)]
     ytd_change = None
-    if pd.notna(ytd_start_month):
-        ytd_start_data = asset_df[asset_df["Month"] == ytd_start_month]
-        ytd_start_value = ytd_start_data["Value"].sum()
-        if ytd_start_value > 0:
-            ytd_change = ((latest_value - ytd_start_value) / ytd_start_value) * 100
-
-    # Calculate monthly aggregated values for additional metrics
-    monthly_agg = get_monthly_aggregation(asset_df)
+    if ytd_start_value > 0:
+        ytd_change = ((latest_value - ytd_start_value) / ytd_start_value) * 100
 
-    # Calculate metrics
-    metrics = {
+    # Calculate metrics (summary statistics taken from the raw monthly array)
+    values = monthly_values.to_numpy()
+    return {
         "latest_value": float(latest_value),
         "mom_change": mom_change,
         "ytd_change": ytd_change,
-        "platforms": int(latest_data["Platform"].nunique()),
-        "assets": int(latest_data["Asset"].nunique()),
-        "months_tracked": int(asset_df["Month"].nunique()),
-        "avg_monthly_value": (
-            float(monthly_agg["Value"].mean()) if not monthly_agg.empty else 0.0
-        ),
-        "max_value": (
-            float(monthly_agg["Value"].max()) if not monthly_agg.empty else 0.0
-        ),
-        "min_value": (
-            float(monthly_agg["Value"].min()) if not monthly_agg.empty else 0.0
-        ),
-        "volatility": (
-            float(monthly_agg["Value"].std()) if not monthly_agg.empty else 0.0
-        ),
+        "platforms": int(latest_counts["Platform"]),
+        "assets": int(latest_counts["Asset"]),
+        "months_tracked": len(monthly_values),
+        "avg_monthly_value": float(values.mean()),
+        "max_value": float(values.max()),
+        "min_value": float(values.min()),
+        "volatility": float(values.std(ddof=1)) if len(values) > 1 else np.nan,
     }
 
-    return metrics
 
+@st.cache_data
+def calculate_all_asset_type_metrics(
+    df: pd.DataFrame,
+) -> Dict[str, Dict[str, Union[float, int, str, None]]]:
+    """
+    Calculate comprehensive metrics for every asset type in one pass.
+
+    Args:
+        df: Input DataFrame with 'Asset_Type', 'Timestamp', 'Value', 'Platform', 'Asset' columns
+
+    Returns:
+        Dictionary mapping each asset type present in the data to its metrics
+    """
+    if df is None or df.empty:
+        return {}
+
+    df = _with_month(df)
+
+    # Sum values and count distinct platforms/assets per asset type and month
+    # (sorted by asset type, then month)
+    grouped = df.groupby(["Asset_Type", "Month"], observed=True)
+    monthly_values = grouped["Value"].sum()
+    monthly_counts = grouped[["Platform", "Asset"]].nunique()
+
+    all_metrics = {}
+    for asset_type, values in monthly_values.groupby(level="Asset_Type", observed=True):
+        values = values.droplevel("Asset_Type")
+        latest_counts = monthly_counts.loc[(asset_type, values.index[-1])]
+        all_metrics[asset_type] = _summarize_monthly_values(values, latest_counts)
+
+    return all_metrics
 
+
+def calculate_asset_type_metrics(
+    df: pd.DataFrame, asset_type: str
+) -> Dict[str, Union[float, int, str, None]]:
+    """
+    Calculate comprehensive metrics for a specific asset type.
+
+    Args:
+        df: Input DataFrame with 'Asset_Type', 'Timestamp', 'Value', 'Platform', 'Asset' columns
+        asset_type: Asset type to calculate metrics for (e.g., 'Cash', 'Investments', 'Pensions')
+
+    Returns:
+        Dictionary containing asset type metrics
+    """
+    if df is None or df.empty:
+        return dict(_EMPTY_ASSET_TYPE_METRICS)
+
+    all_metrics = calculate_all_asset_type_metrics(df)
+
+    return dict(all_metrics.get(asset_type, _EMPTY_ASSET_TYPE_METRICS))
+
+
+@st.cache_data
 def calculate_actual_pension_returns(
     asset_df: pd.DataFrame, cashflows_df: pd.DataFrame
 ) -> pd.DataFrame:
@@ -284,69 +462,61 @@ def calculate_actual_pension_returns(
         return pd.DataFrame()
 
     # --- 1. Prepare Asset Data ---
-    asset_copy = asset_df.copy()
-    asset_copy["Month"] = asset_copy["Timestamp"].dt.to_period("M").dt.to_timestamp()
-    asset_monthly = asset_copy.groupby(["Month", "Asset"])["Value"].last().reset_index()
+    asset_df = _with_month(asset_df)
+    asset_monthly = (
+        asset_df.groupby(["Month", "Asset"], observed=True)["Value"]
+        .last()
+        .reset_index()
+    )
 
     # --- 2. Prepare Cashflow Data ---
     if cashflows_df is not None and not cashflows_df.empty:
-        cashflow_copy = cashflows_df.copy()
-        cashflow_copy["Month"] = (
-            cashflow_copy["Timestamp"].dt.to_period("M").dt.to_timestamp()
-        )
+        cashflows_df = _with_month(cashflows_df)
         cashflow_monthly = (
-            cashflow_copy.groupby(["Month", "Asset"])["Value"].sum().reset_index()
+            cashflows_df.groupby(["Month", "Asset"], observed=True)["Value"]
+            .sum()
+            .reset_index()
         )
         cashflow_monthly = cashflow_monthly.rename(columns={"Value": "Net_Cashflow"})
     else:
         cashflow_monthly = pd.DataFrame(columns=["Month", "Asset", "Net_Cashflow"])
 
     # --- 3. Combine Data and Calculate Returns ---
-    all_returns = []
-    for asset in asset_monthly["Asset"].unique():
-        # Isolate data for one asset
-        single_asset_values = asset_monthly[
-            asset_monthly["Asset"] == asset
-        ].sort_values("Month")
-        single_asset_cashflows = cashflow_monthly[cashflow_monthly["Asset"] == asset]
-
-        # Merge asset values with their corresponding cashflows
-        merged_df = pd.merge(
-            single_asset_values,
-            single_asset_cashflows,
-            on=["Month", "Asset"],
-            how="left",
-        )
-        merged_df["Net_Cashflow"] = merged_df["Net_Cashflow"].fillna(0)
-
-        # Get Start Value (which is the End Value of the previous month)
-        merged_df["Start_Value"] = merged_df["Value"].shift(1)
-
-        # Drop the first row for each asset as it has no previous month to compare against
-        merged_df = merged_df.dropna(subset=["Start_Value"])
-
-        if merged_df.empty:
-            continue
-
-        # Rename columns for clarity before calculation
-        merged_df = merged_df.rename(columns={"Value": "End_Value"})
+    # Merge asset values with their corresponding cashflows
+    merged_df = pd.merge(
+        asset_monthly, cashflow_monthly, on=["Month", "Asset"], how="left"
+    )
+    merged_df["Net_Cashflow"] = merged_df["Net_Cashflow"].fillna(0)
+    merged_df = merged_df.sort_values(["Asset", "Month"], ignore_index=True)
 
-        # Calculate actual return using the correct formula
-        def calculate_return(row):
-            if row["Start_Value"] > 0:
-                # (End - Start - Cashflow) / Start
-                return (
-                    row["End_Value"] - row["Start_Value"] - row["Net_Cashflow"]
-                ) / row["Start_Value"]
-            return 0.0
+    # Get Start Value (which is the End Value of the previous month for the asset)
+    merged_df["Start_Value"] = merged_df.groupby("Asset", observed=True, sort=False)[
+        "Value"
+    ].shift(1)
 
-        merged_df["Actual_Return"] = merged_df.apply(calculate_return, axis=1)
-        all_returns.append(merged_df)
+    # Drop the first row for each asset as it has no previous month to compare against
+    final_returns_df = merged_df.dropna(subset=["Start_Value"])
 
-    if not all_returns:
+    if final_returns_df.empty:
         return pd.DataFrame()
 
-    final_returns_df = pd.concat(all_returns, ignore_index=True)
+    # Rename columns for clarity before calculation
+    final_returns_df = final_returns_df.rename(
+        columns={"Value": "End_Value"}
+    ).reset_index(drop=True)
+
+    # Calculate actual return using the correct formula:
+    # (End - Start - Cashflow) / Start, or 0 when there is no positive start
+    start_value = final_returns_df["Start_Value"].to_numpy()
+    has_start = start_value > 0
+    gain = (
+        final_returns_df["End_Value"].to_numpy()
+        - start_value
+        - final_returns_df["Net_Cashflow"].to_numpy()
+    )
+    final_returns_df["Actual_Return"] = np.where(
+        has_start, gain / np.where(has_start, start_value, 1.0), 0.0
+    )
 
     # Ensure all required columns are present for downstream components
     final_returns_df["Value_Before_Cashflow"] = (
@@ -371,24 +541,20 @@ def get_cumulative_pension_cashflows(cashflows_df: pd.DataFrame) -> pd.DataFrame
     if cashflows_df is None or cashflows_df.empty:
         return pd.DataFrame()
 
-    df = cashflows_df.copy()
-    df["Month"] = df["Timestamp"].dt.to_period("M")
-    monthly_cashflows = df.groupby(["Month", "Asset"])["Value"].sum().reset_index()
-    monthly_cashflows["Month"] = monthly_cashflows["Month"].dt.to_timestamp()
+    df = _with_month(cashflows_df)
+    monthly_cashflows = (
+        df.groupby(["Month", "Asset"], observed=True)["Value"].sum().reset_index()
+    )
 
-    # Calculate cumulative cashflows
-    cumulative_data = []
-    for asset in monthly_cashflows["Asset"].unique():
-        asset_data = monthly_cashflows[monthly_cashflows["Asset"] == asset].sort_values(
-            "Month"
-        )
-        asset_data["Cumulative_Cashflow"] = asset_data["Value"].cumsum()
-        cumulative_data.append(asset_data[["Month", "Asset", "Cumulative_Cashflow"]])
+    # Calculate cumulative cashflows per asset in a single pass
+    monthly_cashflows = monthly_cashflows.sort_values(
+        ["Asset", "Month"], ignore_index=True
+    )
+    monthly_cashflows["Cumulative_Cashflow"] = monthly_cashflows.groupby(
+        "Asset", observed=True, sort=False
+    )["Value"].cumsum()
 
-    if cumulative_data:
-        return pd.concat(cumulative_data, ignore_index=True)
-    else:
-        return pd.DataFrame()
+    return monthly_cashflows[["Month", "Asset", "Cumulative_Cashflow"]]
 
 
 def calculate_actual_mom_changes(
@@ -409,13 +575,13 @@ def calculate_actual_mom_changes(
     if actual_returns.empty:
         return pd.DataFrame()
 
-    # The actual returns are already the MoM changes
-    mom_data = actual_returns[["Month", "Asset", "Actual_Return"]].copy()
-    mom_data = mom_data.rename(columns={"Actual_Return": "Actual_MoM_Change"})
-
-    return mom_data
+    # The actual returns are already the MoM changes; only relabel the column
+    return actual_returns.loc[:, ["Month", "Asset", "Actual_Return"]].set_axis(
+        ["Month", "Asset", "Actual_MoM_Change"], axis=1
+    )
 
 
+@st.cache_data
 def calculate_allocation_metrics(
     df: pd.DataFrame,
 ) -> Tuple[
@@ -440,98 +606,143 @@ def calculate_allocation_metrics(
     if df is None or df.empty:
         return {}, pd.Timestamp.now(), None, None
 
-    # Ensure timestamp is datetime
-    df_copy = df.copy()
-    df_copy["Timestamp"] = pd.to_datetime(df_copy["Timestamp"])
-    df_copy["Month"] = df_copy["Timestamp"].dt.to_period("M")
+    df = _with_month(df)
 
-    # Get time periods
-    latest_month = df_copy["Month"].max()
-    previous_month = df_copy[df_copy["Month"] < latest_month]["Month"].max()
-    current_year = latest_month.year
-    ytd_start_month = df_copy[df_copy["Month"].dt.year == current_year]["Month"].min()
-
-    # Convert periods to timestamps
-    latest_month_ts = latest_month.to_timestamp()
-    previous_month_ts = (
-        previous_month.to_timestamp() if pd.notna(previous_month) else None
-    )
-    ytd_start_month_ts = (
-        ytd_start_month.to_timestamp() if pd.notna(ytd_start_month) else None
+    # Sum values per month and asset type in a single pass (sorted by month)
+    monthly_values = (
+        df.groupby(["Month", "Asset_Type"], observed=True)["Value"]
+        .sum()
+        .unstack("Asset_Type", fill_value=0.0)
     )
+    monthly_totals = monthly_values.sum(axis=1)
 
-    # Get latest month data
-    latest_data = df_copy[df_copy["Month"] == latest_month]
-    total_current = latest_data["Value"].sum()
+    # Get time periods
+    months = monthly_values.index
+    latest_month = months[-1]
+    previous_month = months[-2] if len(months) > 1 else None
+    ytd_start_month = months[_ytd_start_position(months)]
 
-    # Calculate metrics for each asset type
-    allocation_metrics = {}
+    asset_types = [
+        ASSET_TYPES["CASH"],
+        ASSET_TYPES["INVESTMENTS"],
+        ASSET_TYPES["PENSIONS"],
+    ]
+    monthly_values = monthly_values.reindex(columns=asset_types, fill_value=0.0)
 
-    # Total portfolio metrics
-    if pd.notna(previous_month):
-        previous_data = df_copy[df_copy["Month"] == previous_month]
-        total_previous = previous_data["Value"].sum()
-        mom_increase = total_current - total_previous if total_previous > 0 else None
-    else:
-        mom_increase = None
+    # Latest month values
+    current_values = monthly_values.loc[latest_month]
+    total_current = monthly_totals.loc[latest_month]
 
-    if pd.notna(ytd_start_month):
-        ytd_start_data = df_copy[df_copy["Month"] == ytd_start_month]
-        total_ytd_start = ytd_start_data["Value"].sum()
-        ytd_increase = total_current - total_ytd_start if total_ytd_start > 0 else None
-    else:
-        ytd_increase = None
+    def pct_increase_from(month):
+        """Percentage change of each asset type since ``month`` (NaN if base <= 0)."""
+        base = monthly_values.loc[month]
+        return ((current_values - base) / base * 100).where(base > 0)
 
-    allocation_metrics["Total"] = {
-        "current": float(total_current),
-        "mom_increase": mom_increase,
-        "ytd_increase": ytd_increase,
+    # Total portfolio metrics
+    mom_increase = None
+    if previous_month is not None and monthly_totals.loc[previous_month] > 0:
+        mom_increase = total_current - monthly_totals.loc[previous_month]
+
+    total_ytd_start = monthly_totals.loc[ytd_start_month]
+    ytd_increase = total_current - total_ytd_start if total_ytd_start > 0 else None
+
+    allocation_metrics = {
+        "Total": {
+            "current": float(total_current),
+            "mom_increase": mom_increase,
+            "ytd_increase": ytd_increase,
+        }
     }
 
     # Asset type specific metrics
-    for asset_type in [
-        ASSET_TYPES["CASH"],
-        ASSET_TYPES["INVESTMENTS"],
-        ASSET_TYPES["PENSIONS"],
-    ]:
-        asset_data = latest_data[latest_data["Asset_Type"] == asset_type]
-        current_value = asset_data["Value"].sum()
-        allocation_pct = (
-            (current_value / total_current * 100) if total_current > 0 else 0
-        )
-
-        # MoM change
-        mom_pct_increase = None
-        if pd.notna(previous_month):
-            prev_asset_data = df_copy[
-                (df_copy["Month"] == previous_month)
-                & (df_copy["Asset_Type"] == asset_type)
-            ]
-            prev_value = prev_asset_data["Value"].sum()
-            if prev_value > 0:
-                mom_pct_increase = ((current_value - prev_value) / prev_value) * 100
-
-        # YTD change
-        ytd_pct_increase = None
-        if pd.notna(ytd_start_month):
-            ytd_asset_data = df_copy[
-                (df_copy["Month"] == ytd_start_month)
-                & (df_copy["Asset_Type"] == asset_type)
-            ]
-            ytd_start_value = ytd_asset_data["Value"].sum()
-            if ytd_start_value > 0:
-                ytd_pct_increase = (
-                    (current_value - ytd_start_value) / ytd_start_value
-                ) * 100
+    allocation_pcts = (
+        current_values / total_current * 100
+        if total_current > 0
+        else current_values * 0
+    )
+    mom_pct_increases = (
+        pct_increase_from(previous_month)
+        if previous_month is not None
+        else pd.Series(np.nan, index=asset_types)
+    )
+    ytd_pct_increases = pct_increase_from(ytd_start_month)
 
+    for asset_type in asset_types:
+        mom_pct_increase = mom_pct_increases[asset_type]
+        ytd_pct_increase = ytd_pct_increases[asset_type]
         allocation_metrics[asset_type] = {
-            "current": float(current_value),
-            "allocation": float(allocation_pct),
-            "mom_pct_increase": mom_pct_increase,
-            "ytd_pct_increase": ytd_pct_increase,
+            "current": float(current_values[asset_type]),
+            "allocation": float(allocation_pcts[asset_type]),
+            "mom_pct_increase": (
+                None if pd.isna(mom_pct_increase) else mom_pct_increase
+            ),
+            "ytd_pct_increase": (
+                None if pd.isna(ytd_pct_increase) else ytd_pct_increase
+            ),
         }
 
-    return allocation_metrics, latest_month_ts, previous_month_ts, ytd_start_month_ts
+    return allocation_metrics, latest_month, previous_month, ytd_start_month
+
+
+@st.cache_data
+def calculate_summary_statistics(
+    df: pd.DataFrame, latest_month: pd.Timestamp
+) -> Tuple[int, int, int, int]:
+    """
+    Count platforms, assets, months tracked and records in the latest month.
+
+    Args:
+        df: Input DataFrame with 'Platform' and 'Timestamp' columns
+        latest_month: Month whose records are counted (any timestamp in the month)
+
+    Returns:
+        Tuple of (total platforms, total assets, months tracked, latest records)
+    """
+    total_platforms = df["Platform"].nunique()
+    total_assets = df["Asset"].nunique() if "Asset" in df.columns else 0
+
+    # Month of each record as a datetime64[M] key (comparisons run on int64)
+    months = _month_key(df).to_numpy().astype("datetime64[M]")
+    latest_month_key = latest_month.to_datetime64().astype("datetime64[M]")
+    months_tracked = len(pd.unique(months))
+    latest_records = int((months == latest_month_key).sum())
+
+    return total_platforms, total_assets, months_tracked, latest_records
+
+
+@st.cache_data
+def compute_all_time_periods(
+    df: pd.DataFrame,
+) -> Dict[str, Tuple[pd.Timestamp, Optional[pd.Timestamp], Optional[pd.Timestamp]]]:
+    """
+    Get time periods (latest, previous, YTD start) for every asset type in one pass.
+
+    Args:
+        df: Input DataFrame with 'Asset_Type' and 'Timestamp' columns
+
+    Returns:
+        Dictionary mapping each asset type present in the data to a tuple of:
+        - Latest month timestamp
+        - Previous month timestamp (or None)
+        - YTD start month timestamp
+    """
+    if df is None or df.empty:
+        return {}
+
+    df = _with_month(df)
+
+    # Distinct months per asset type (sorted by asset type, then month)
+    monthly_counts = df.groupby(["Asset_Type", "Month"], observed=True).size()
+
+    time_periods = {}
+    for asset_type, counts in monthly_counts.groupby(level="Asset_Type", observed=True):
+        months = counts.index.get_level_values("Month")
+        latest_month = months[-1]
+        previous_month = months[-2] if len(months) > 1 else None
+        ytd_start_month = months[_ytd_start_position(months)]
+        time_periods[asset_type] = (latest_month, previous_month, ytd_start_month)
+
+    return time_periods
 
 
 def get_asset_type_time_periods(
@@ -553,37 +764,14 @@ def get_asset_type_time_periods(
     if df is None or df.empty:
         return pd.Timestamp.now(), None, None
 
-    # Filter data for the specific asset type
-    asset_df = filter_by_asset_type(df, asset_type)
-
-    if asset_df.empty:
+    time_periods = compute_all_time_periods(df)
+    if asset_type not in time_periods:
         return pd.Timestamp.now(), None, None
 
-    # Ensure timestamp is datetime
-    asset_df_copy = asset_df.copy()
-    asset_df_copy["Timestamp"] = pd.to_datetime(asset_df_copy["Timestamp"])
-    asset_df_copy["Month"] = asset_df_copy["Timestamp"].dt.to_period("M")
-
-    # Get time periods
-    latest_month = asset_df_copy["Month"].max()
-    previous_month = asset_df_copy[asset_df_copy["Month"] < latest_month]["Month"].max()
-    current_year = latest_month.year
-    ytd_start_month = asset_df_copy[asset_df_copy["Month"].dt.year == current_year][
-        "Month"
-    ].min()
-
-    # Convert periods to timestamps
-    latest_month_ts = latest_month.to_timestamp()
-    previous_month_ts = (
-        previous_month.to_timestamp() if pd.notna(previous_month) else None
-    )
-    ytd_start_month_ts = (
-        ytd_start_month.to_timestamp() if pd.notna(ytd_start_month) else None
-    )
-
-    return latest_month_ts, previous_month_ts, ytd_start_month_ts
+    return time_periods[asset_type]
 
 
+@st.cache_data
 def create_platform_trends_data(df: pd.DataFrame) -> pd.DataFrame:
     """
     Create platform trends data for time series charts.
@@ -597,23 +785,28 @@ def create_platform_trends_data(df: pd.DataFrame) -> pd.DataFrame:
     if df is None or df.empty:
         return pd.DataFrame()
 
-    df_copy = df.copy()
-    df_copy["Month"] = df_copy["Timestamp"].dt.to_period("M").dt.to_timestamp()
+    df = _with_month(df)
 
-    # Create pivot table for platform trends
-    platform_trends = df_copy.pivot_table(
-        index="Month", columns="Platform", values="Value", aggfunc="sum"
-    ).reset_index()
+    # Sum values per month and platform; months without a platform stay NaN
+    platform_trends = (
+        df.groupby(["Month", "Platform"], observed=True)["Value"]
+        .sum()
+        .unstack("Platform")
+    )
 
-    return platform_trends
+    return platform_trends.reset_index()
 
 
-def create_allocation_time_series(df: pd.DataFrame) -> pd.DataFrame:
+@st.cache_data
+def create_allocation_time_series(
+    df: pd.DataFrame, tail_months: Optional[int] = None
+) -> pd.DataFrame:
     """
     Create allocation time series data showing percentage allocation by asset type over time.
 
     Args:
         df: Input DataFrame with 'Asset_Type', 'Timestamp', 'Value' columns
+        tail_months: Only include the most recent N months (default: all months)
 
     Returns:
         DataFrame with Month as index and allocation percentage columns for each asset type
@@ -621,43 +814,38 @@ def create_allocation_time_series(df: pd.DataFrame) -> pd.DataFrame:
     if df is None or df.empty:
         return pd.DataFrame()
 
-    df_copy = df.copy()
-    df_copy["Timestamp"] = pd.to_datetime(df_copy["Timestamp"])
-    df_copy["Month"] = df_copy["Timestamp"].dt.to_period("M")
+    df_copy = _with_month(df)
+
+    # Restrict to the trailing window before grouping
+    if tail_months is not None:
+        first_month = df_copy["Month"].max() - pd.DateOffset(months=tail_months - 1)
+        df_copy = df_copy[df_copy["Month"] >= first_month]
+
+    # Sum values per month and asset type in a single pass (sorted by month)
+    monthly_values = (
+        df_copy.groupby(["Month", "Asset_Type"], observed=True)["Value"]
+        .sum()
+        .unstack("Asset_Type", fill_value=0.0)
+    )
+    totals = monthly_values.sum(axis=1)
 
     # Calculate monthly allocation percentages for each asset type
-    allocation_time_series = []
-    for month in df_copy["Month"].unique():
-        month_data = df_copy[df_copy["Month"] == month]
-        total_value = month_data["Value"].sum()
-
-        month_allocation = {
-            "Month": month.to_timestamp()
-        }  # Convert Period to timestamp
-        for asset_type in [
-            ASSET_TYPES["CASH"],
-            ASSET_TYPES["INVESTMENTS"],
-            ASSET_TYPES["PENSIONS"],
-        ]:
-            asset_value = month_data[month_data["Asset_Type"] == asset_type][
-                "Value"
-            ].sum()
-            allocation_pct = (
-                (asset_value / total_value) if total_value > 0 else 0
-            )  # Return as decimal (0.255 for 25.5%)
-            month_allocation[f"{asset_type} Allocation %"] = allocation_pct
-
-        allocation_time_series.append(month_allocation)
-
-    allocation_df = pd.DataFrame(allocation_time_series)
-
-    # Sort by month for proper time series display
-    if not allocation_df.empty:
-        allocation_df = allocation_df.sort_values("Month")
-
-    return allocation_df
+    asset_types = [
+        ASSET_TYPES["CASH"],
+        ASSET_TYPES["INVESTMENTS"],
+        ASSET_TYPES["PENSIONS"],
+    ]
+    allocation_df = (
+        monthly_values.reindex(columns=asset_types, fill_value=0.0)
+        .div(totals.where(totals > 0), axis=0)
+        .fillna(0.0)
+    )  # Return as decimal (0.255 for 25.5%)
+    allocation_df.columns = [f"{asset_type} Allocation %" for asset_type in asset_types]
 
+    return allocation_df.rename_axis("Month").reset_index()
 
+
+@st.cache_data
 def create_platform_allocation_time_series(
     df: pd.DataFrame, asset_type: str
 ) -> pd.DataFrame:
@@ -671,29 +859,24 @@ def create_platform_allocation_time_series(
     """
     if df is None or df.empty:
         return pd.DataFrame()
-    df_copy = df.copy()
-    df_copy = df_copy[df_copy["Asset_Type"] == asset_type]
+    df_copy = _with_month(df[df["Asset_Type"] == asset_type])
     if df_copy.empty:
         return pd.DataFrame()
-    df_copy["Month"] = df_copy["Timestamp"].dt.to_period("M")
-    allocation_time_series = []
-    for month in df_copy["Month"].unique():
-        month_data = df_copy[df_copy["Month"] == month]
-        total_value = month_data["Value"].sum()
-        month_allocation = {"Month": month.to_timestamp()}
-        for platform in month_data["Platform"].unique():
-            platform_value = month_data[month_data["Platform"] == platform][
-                "Value"
-            ].sum()
-            allocation_pct = (platform_value / total_value) if total_value > 0 else 0
-            month_allocation[platform] = allocation_pct
-        allocation_time_series.append(month_allocation)
-    allocation_df = pd.DataFrame(allocation_time_series)
-    if not allocation_df.empty:
-        allocation_df = allocation_df.sort_values("Month")
-    return allocation_df
+    # Platforms absent from a month stay NaN so they leave a gap in the chart
+    platform_values = (
+        df_copy.groupby(["Month", "Platform"], observed=True)["Value"]
+        .sum()
+        .unstack("Platform")
+    )
+    totals = platform_values.sum(axis=1)
+    allocation_df = platform_values.div(totals.where(totals > 0), axis=0)
+    allocation_df = allocation_df.mask(
+        platform_values.notna() & allocation_df.isna(), 0.0
+    )
+    return allocation_df.rename_axis(index="Month", columns=None).reset_index()
 
 
+@st.cache_data
 def forecast_pension_growth(
     historical_df: pd.DataFrame,
     forecast_years: int,
@@ -701,6 +884,7 @@ def forecast_pension_growth(
     annual_return_rate: float,
     annual_volatility: float = 0.15,
     confidence_level: float = 0.90,
+    seed: Optional[int] = None,
 ) -> pd.DataFrame:
     """
     Forecasts pension growth using a simple Monte Carlo simulation.
@@ -712,6 +896,8 @@ def forecast_pension_growth(
         annual_return_rate (float): The expected average annual return (as a decimal, e.g., 0.07 for 7%).
         annual_volatility (float): The expected annual volatility (standard deviation).
         confidence_level (float): The confidence level for the upper and lower bounds (e.g., 0.90 for 90%).
+        seed (int, optional): Seed for the random number generator. Results are cached
+            per seed, so pass a new seed to draw a new sample.
 
     Returns:
         pd.DataFrame: A DataFrame containing the full projection with columns
@@ -733,29 +919,32 @@ def forecast_pension_growth(
     num_simulations = 500  # Number of Monte Carlo simulations to run
 
     # --- 2. Run Monte Carlo Simulation ---
-    all_simulations = np.zeros((num_months + 1, num_simulations))
-    all_simulations[0, :] = last_historical_value
+    # Draw every month's returns for all simulations at once. The shocks are drawn
+    # in single precision, but paths compound in double precision.
+    rng = np.random.default_rng(seed)
+    shocks = rng.standard_normal((num_months, num_simulations), dtype=np.float32)
+    growth_factors = (
+        1 + monthly_return_rate + monthly_volatility * shocks.astype(np.float64)
+    )
 
-    for t in range(1, num_months + 1):
-        # Generate random returns for this month across all simulations
-        random_returns = np.random.normal(
-            monthly_return_rate, monthly_volatility, num_simulations
-        )
-        # Calculate the new value for each simulation
-        all_simulations[t, :] = (
-            all_simulations[t - 1, :] * (1 + random_returns) + monthly_contribution
-        )
+    # The recurrence V_t = V_{t-1} * g_t + C unrolls to
+    # V_t = G_t * (V_0 + C * sum_{k<=t} 1 / G_k), where G_t is the cumulative growth
+    cumulative_growth = np.cumprod(growth_factors, axis=0)
+    all_simulations = np.empty((num_months + 1, num_simulations))
+    all_simulations[0, :] = last_historical_value
+    all_simulations[1:, :] = cumulative_growth * (
+        last_historical_value
+        + monthly_contribution * np.cumsum(1 / cumulative_growth, axis=0)
+    )
 
     # --- 3. Aggregate Results ---
-    projection_df = pd.DataFrame(all_simulations)
-
-    # Calculate median, lower, and upper bounds
+    # Calculate lower, median, and upper bounds in a single quantile pass
     lower_percentile = (1 - confidence_level) / 2
     upper_percentile = 1 - lower_percentile
 
-    median_projection = projection_df.quantile(q=0.5, axis=1)
-    lower_bound = projection_df.quantile(q=lower_percentile, axis=1)
-    upper_bound = projection_df.quantile(q=upper_percentile, axis=1)
+    lower_bound, median_projection, upper_bound = np.quantile(
+        all_simulations, [lower_percentile, 0.5, upper_percentile], axis=1
+    )
 
     # --- 4. Format Output DataFrame ---
     forecast_dates = pd.to_datetime(
@@ -772,8 +961,9 @@ def forecast_pension_growth(
     )
 
     # Combine with historical data for a continuous chart
-    historical_formatted = historical_df[["Month", "Value"]].copy()
-    historical_formatted.rename(columns={"Value": "Projected_Value"}, inplace=True)
+    historical_formatted = historical_df[["Month", "Value"]].rename(
+        columns={"Value": "Projected_Value"}
+    )
     historical_formatted["Type"] = "Historical"
 
     forecast_results["Type"] = "Forecast"
@@ -793,6 +983,7 @@ def forecast_pension_growth(
 # Car-specific data processing functions
 
 
+@st.cache_data
 def calculate_car_equity(car_assets_df: pd.DataFrame) -> pd.DataFrame:
     """
     Calculate equity for each car based on loan status.
@@ -806,32 +997,30 @@ def calculate_car_equity(car_assets_df: pd.DataFrame) -> pd.DataFrame:
     if car_assets_df is None or car_assets_df.empty:
         return pd.DataFrame()
 
-    df = car_assets_df.copy()
-
-    # Calculate equity based on loan status
-    def calculate_equity(row):
-        if pd.isna(row["Car_Value"]):
-            return None
-
-        if row["Loan_Status"] == CAR_LOAN_STATUSES["OWNED"]:
-            return row["Car_Value"]  # 100% equity for owned vehicles
-        elif row["Loan_Status"] == CAR_LOAN_STATUSES["FINANCED"]:
-            loan_balance = row["Loan_Balance"] if pd.notna(row["Loan_Balance"]) else 0
-            return row["Car_Value"] - loan_balance
-        else:
-            return None
-
-    df["Equity"] = df.apply(calculate_equity, axis=1)
-    df["Equity_Percentage"] = (df["Equity"] / df["Car_Value"] * 100).where(
-        df["Car_Value"] > 0
+    loan_status = car_assets_df["Loan_Status"]
+    car_value = car_assets_df["Car_Value"]
+    loan_balance = car_assets_df["Loan_Balance"]
+    financed = loan_status == CAR_LOAN_STATUSES["FINANCED"]
+
+    # Calculate equity based on loan status: owned vehicles are 100% equity,
+    # financed ones net of the outstanding loan (missing balances count as 0)
+    equity = np.where(
+        loan_status == CAR_LOAN_STATUSES["OWNED"],
+        car_value,
+        np.where(financed, car_value - loan_balance.fillna(0), np.nan),
     )
-    df["LTV_Ratio"] = (df["Loan_Balance"] / df["Car_Value"] * 100).where(
-        (df["Loan_Status"] == CAR_LOAN_STATUSES["FINANCED"]) & (df["Car_Value"] > 0)
+    equity = pd.Series(equity, index=car_assets_df.index).where(car_value.notna())
+
+    df = car_assets_df.assign(
+        Equity=equity,
+        Equity_Percentage=(equity / car_value * 100).where(car_value > 0),
+        LTV_Ratio=(loan_balance / car_value * 100).where(financed & (car_value > 0)),
     )
 
     return df
 
 
+@st.cache_data
 def calculate_car_monthly_costs(
     car_expenses_df: pd.DataFrame,
     car_payments_df: pd.DataFrame,
@@ -852,60 +1041,47 @@ def calculate_car_monthly_costs(
         return pd.DataFrame()
 
     # Prepare expenses data
-    expenses_df = car_expenses_df.copy()
-    expenses_df["Month"] = expenses_df["Timestamp"].dt.to_period("M")
-
-    # Group expenses by month and type
-    monthly_expenses = (
-        expenses_df.groupby(["Month", "Expense_Type"])["Amount"].sum().reset_index()
-    )
-
-    # Pivot to get expense types as columns
-    monthly_expenses_pivot = monthly_expenses.pivot_table(
-        index="Month",
-        columns="Expense_Type",
-        values="Amount",
-        aggfunc="sum",
-        fill_value=0,
-    ).reset_index()
+    expenses_df = _with_month(car_expenses_df)
+    costs = [expenses_df[["Month", "Expense_Type", "Amount"]]]
 
-    # Add loan payments if available
+    # Add loan payments if available, as one more cost type in long form (only for
+    # months that have expenses)
     if car_payments_df is not None and not car_payments_df.empty:
-        payments_df = car_payments_df.copy()
-        payments_df["Month"] = payments_df["Timestamp"].dt.to_period("M")
+        payments_df = _with_month(car_payments_df)
+        payments_df = payments_df[payments_df["Month"].isin(expenses_df["Month"])]
 
         # Include all payment types (not just regular) to ensure we capture all loan payments
-        monthly_loan_payments = (
-            payments_df.groupby("Month")["Payment_Amount"].sum().reset_index()
+        costs.append(
+            pd.DataFrame(
+                {
+                    "Month": payments_df["Month"],
+                    "Expense_Type": "Loan_Payment",
+                    "Amount": payments_df["Payment_Amount"],
+                }
+            )
         )
 
-        # Merge with expenses
-        monthly_expenses_pivot = monthly_expenses_pivot.merge(
-            monthly_loan_payments, on="Month", how="left"
-        )
-        monthly_expenses_pivot["Loan_Payment"] = monthly_expenses_pivot[
-            "Payment_Amount"
-        ].fillna(0)
-        monthly_expenses_pivot = monthly_expenses_pivot.drop("Payment_Amount", axis=1)
-    else:
-        monthly_expenses_pivot["Loan_Payment"] = 0
+    # Sum costs by month and type in one pass, with cost types as columns
+    monthly_costs = (
+        pd.concat(costs, ignore_index=True)
+        .groupby(["Month", "Expense_Type"], observed=True)["Amount"]
+        .sum()
+        .unstack("Expense_Type", fill_value=0.0)
+    )
 
-    # Calculate total monthly costs
-    expense_columns = [
-        col
-        for col in monthly_expenses_pivot.columns
-        if col not in ["Month", "Loan_Payment"]
-    ]
-    monthly_expenses_pivot["Total"] = monthly_expenses_pivot[
-        expense_columns + ["Loan_Payment"]
-    ].sum(axis=1)
+    # Keep loan payments after the expense columns
+    expense_columns = [col for col in monthly_costs.columns if col != "Loan_Payment"]
+    monthly_costs = monthly_costs.reindex(
+        columns=expense_columns + ["Loan_Payment"], fill_value=0.0
+    )
 
-    # Convert Month back to timestamp
-    monthly_expenses_pivot["Month"] = monthly_expenses_pivot["Month"].dt.to_timestamp()
+    # Calculate total monthly costs
+    monthly_costs["Total"] = monthly_costs.to_numpy(dtype="float64").sum(axis=1)
 
-    return monthly_expenses_pivot
+    return monthly_costs.rename_axis(columns=None).reset_index()
 
 
+@st.cache_data
 def get_car_equity_trends(car_assets_df: pd.DataFrame) -> pd.DataFrame:
     """
     Create equity trends over time for cars.
@@ -925,25 +1101,45 @@ def get_car_equity_trends(car_assets_df: pd.DataFrame) -> pd.DataFrame:
     if df_with_equity.empty:
         return pd.DataFrame()
 
-    # Create time series of equity by car
-    equity_trends = (
-        df_with_equity.groupby(["Timestamp", "Asset"])["Equity"].sum().reset_index()
+    # Create time series of equity by car, with cars as columns (timestamps
+    # without a reading for a car stay NaN)
+    equity_pivot = (
+        df_with_equity.groupby(["Timestamp", "Asset"], observed=True)["Equity"]
+        .sum()
+        .unstack("Asset")
     )
 
-    # Pivot to get cars as columns
-    equity_pivot = equity_trends.pivot_table(
-        index="Timestamp", columns="Asset", values="Equity", aggfunc="sum"
-    ).reset_index()
+    return equity_pivot.reset_index()
 
-    return equity_pivot
 
+def _in_year(df: pd.DataFrame, year: int) -> np.ndarray:
+    """
+    Build a boolean mask of rows whose 'Timestamp' falls in ``year``.
 
-def _calculate_ytd_mileage(car_assets_df: pd.DataFrame) -> float:
+    Args:
+        df: Input DataFrame with a datetime 'Timestamp' column
+        year: Calendar year to select
+
+    Returns:
+        Boolean NumPy array aligned with the rows of ``df``
+    """
+    years = df["Timestamp"].to_numpy().astype("datetime64[Y]").astype(np.int64)
+    return years + 1970 == year
+
+
+def _calculate_ytd_mileage(
+    car_assets_df: pd.DataFrame,
+    current_year: int,
+    latest_readings: Optional[pd.DataFrame] = None,
+) -> float:
     """
     Helper function to calculate YTD mileage for vehicles.
 
     Args:
         car_assets_df: DataFrame with car assets data
+        current_year: Calendar year the mileage is counted for
+        latest_readings: Latest 'Asset' and 'Mileage' per vehicle, if the caller
+            has already computed them
 
     Returns:
         Total YTD mileage across all vehicles
@@ -952,33 +1148,24 @@ def _calculate_ytd_mileage(car_assets_df: pd.DataFrame) -> float:
     if car_assets_df is None or car_assets_df.empty:
         return 0.0
 
-    current_year = datetime.now().year
-
     # Get first mileage reading of the year for each vehicle
-    ytd_start_data = car_assets_df[
-        car_assets_df["Timestamp"].dt.year == current_year
-    ].copy()
-    if ytd_start_data.empty:
+    in_year = _in_year(car_assets_df, current_year)
+    if not in_year.any():
         return 0.0
 
-    # Group by vehicle and get the earliest reading of the year
-    first_readings = ytd_start_data.groupby("Asset")["Mileage"].first().reset_index()
+    mileage = car_assets_df["Mileage"]
+    vehicles = car_assets_df["Asset"]
+    first_readings = mileage[in_year].groupby(vehicles[in_year], observed=True).first()
 
-    # Get latest data for each car
-    car_assets_with_equity = calculate_car_equity(car_assets_df)
-    latest_car_data = car_assets_with_equity.groupby("Asset").last().reset_index()
-    latest_readings = latest_car_data[["Asset", "Mileage"]]
-
-    # Merge to get first and latest readings for each vehicle
-    mileage_comparison = latest_readings.merge(
-        first_readings, on="Asset", suffixes=("_latest", "_first")
-    )
+    # Get latest mileage for each car
+    if latest_readings is None:
+        latest_mileage = mileage.groupby(vehicles, observed=True).last()
+    else:
+        latest_mileage = latest_readings.set_index("Asset")["Mileage"]
 
-    # Calculate YTD mileage for each vehicle
-    mileage_comparison["ytd_mileage"] = (
-        mileage_comparison["Mileage_latest"] - mileage_comparison["Mileage_first"]
-    )
-    return mileage_comparison["ytd_mileage"].sum()
+    # YTD mileage per vehicle (aligned on vehicle; vehicles missing either
+    # reading are skipped by the sum)
+    return (latest_mileage - first_readings).sum()
 
 
 def calculate_vehicle_metrics(
@@ -994,6 +1181,32 @@ def calculate_vehicle_metrics(
         car_expenses_df: DataFrame with car expenses data
         car_payments_df: DataFrame with car payments data
 
+    Returns:
+        Dictionary with vehicle metrics
+    """
+    # The current year is part of the cache key, so YTD figures roll over on
+    # 1 January without clearing the cache
+    return _calculate_vehicle_metrics(
+        car_assets_df, car_expenses_df, car_payments_df, datetime.now().year
+    )
+
+
+@st.cache_data
+def _calculate_vehicle_metrics(
+    car_assets_df: pd.DataFrame,
+    car_expenses_df: pd.DataFrame,
+    car_payments_df: pd.DataFrame,
+    current_year: int,
+) -> Dict[str, float]:
+    """
+    Calculate vehicle metrics with YTD figures for the given year.
+
+    Args:
+        car_assets_df: DataFrame with car assets data
+        car_expenses_df: DataFrame with car expenses data
+        car_payments_df: DataFrame with car payments data
+        current_year: Calendar year the YTD figures are counted for
+
     Returns:
         Dictionary with vehicle metrics
     """
@@ -1007,29 +1220,21 @@ def calculate_vehicle_metrics(
 
     # Get latest loan payment
     if car_payments_df is not None and not car_payments_df.empty:
-        latest_payment = car_payments_df.sort_values("Timestamp").iloc[-1]
+        # Position of the last row holding the latest timestamp (no sort needed)
+        timestamps = car_payments_df["Timestamp"].to_numpy()
+        latest_index = len(timestamps) - 1 - timestamps[::-1].argmax()
+        latest_payment_amount = car_payments_df["Payment_Amount"].iat[latest_index]
         metrics["latest_loan_payment"] = (
-            latest_payment["Payment_Amount"]
-            if pd.notna(latest_payment["Payment_Amount"])
-            else 0.0
+            latest_payment_amount if pd.notna(latest_payment_amount) else 0.0
         )
 
     # Get latest monthly expenses
     if car_expenses_df is not None and not car_expenses_df.empty:
-        # Get the latest month with expenses
-        car_expenses_df_copy = car_expenses_df.copy()
-        car_expenses_df_copy["Month"] = car_expenses_df_copy["Timestamp"].dt.to_period(
-            "M"
-        )
-        latest_month = car_expenses_df_copy["Month"].max()
-        latest_month_expenses = car_expenses_df_copy[
-            car_expenses_df_copy["Month"] == latest_month
-        ]
-        metrics["latest_monthly_expenses"] = (
-            latest_month_expenses["Amount"].sum()
-            if not latest_month_expenses.empty
-            else 0.0
-        )
+        # Get the latest month with expenses (only the amounts are read)
+        months = _month_key(car_expenses_df)
+        metrics["latest_monthly_expenses"] = car_expenses_df.loc[
+            months == months.max(), "Amount"
+        ].sum()
 
     # Calculate combined loan + expenses for latest month
     metrics["latest_month_combined_costs"] = (
@@ -1037,29 +1242,20 @@ def calculate_vehicle_metrics(
     )
 
     # Calculate YTD mileage for cost per mile calculation
-    ytd_mileage = _calculate_ytd_mileage(car_assets_df)
+    ytd_mileage = _calculate_ytd_mileage(car_assets_df, current_year)
 
     # Calculate cost per mile (including loan payments and expenses)
     total_ytd_costs = 0.0
-    current_year = datetime.now().year
 
     if car_expenses_df is not None and not car_expenses_df.empty:
         # Get YTD expenses
-        ytd_expenses = car_expenses_df[
-            car_expenses_df["Timestamp"].dt.year == current_year
-        ]
-        total_ytd_costs += (
-            ytd_expenses["Amount"].sum() if not ytd_expenses.empty else 0.0
-        )
+        in_year = _in_year(car_expenses_df, current_year)
+        total_ytd_costs += car_expenses_df.loc[in_year, "Amount"].sum()
 
     if car_payments_df is not None and not car_payments_df.empty:
         # Get YTD loan payments
-        ytd_payments = car_payments_df[
-            car_payments_df["Timestamp"].dt.year == current_year
-        ]
-        total_ytd_costs += (
-            ytd_payments["Payment_Amount"].sum() if not ytd_payments.empty else 0.0
-        )
+        in_year = _in_year(car_payments_df, current_year)
+        total_ytd_costs += car_payments_df.loc[in_year, "Payment_Amount"].sum()
 
     # Calculate cost per mile
     if ytd_mileage > 0:
@@ -1077,6 +1273,24 @@ def calculate_vehicle_summary_metrics(
     Args:
         car_assets_df: DataFrame with car assets data
 
+    Returns:
+        Dictionary with vehicle summary metrics
+    """
+    # The current year is part of the cache key (see calculate_vehicle_metrics)
+    return _calculate_vehicle_summary_metrics(car_assets_df, datetime.now().year)
+
+
+@st.cache_data
+def _calculate_vehicle_summary_metrics(
+    car_assets_df: pd.DataFrame, current_year: int
+) -> Dict[str, Union[float, int, str]]:
+    """
+    Calculate vehicle summary metrics with YTD mileage for the given year.
+
+    Args:
+        car_assets_df: DataFrame with car assets data
+        current_year: Calendar year the YTD mileage is counted for
+
     Returns:
         Dictionary with vehicle summary metrics
     """
@@ -1095,51 +1309,41 @@ def calculate_vehicle_summary_metrics(
     if car_assets_df is None or car_assets_df.empty:
         return metrics
 
-    # Calculate equity for all cars
-    car_assets_with_equity = calculate_car_equity(car_assets_df)
-
-    # Get latest data for each car
-    latest_car_data = car_assets_with_equity.groupby("Asset").last().reset_index()
-
-    # Calculate summary metrics
-    metrics["total_car_value"] = (
-        latest_car_data["Car_Value"].sum()
-        if not latest_car_data["Car_Value"].isna().all()
-        else 0.0
-    )
-    metrics["total_equity"] = (
-        latest_car_data["Equity"].sum()
-        if not latest_car_data["Equity"].isna().all()
-        else 0.0
-    )
-    metrics["total_loan_balance"] = (
-        latest_car_data["Loan_Balance"].sum()
-        if not latest_car_data["Loan_Balance"].isna().all()
-        else 0.0
+    # Get latest data for each car, then calculate equity for those rows only
+    # (equity is a row-wise function of the car's value, loan balance and status)
+    latest_car_data = calculate_car_equity(
+        car_assets_df.groupby("Asset", observed=True).last().reset_index()
     )
 
-    # Count vehicles by status
-    from utils import CAR_LOAN_STATUSES
+    # Calculate summary metrics in one pass (all-missing columns sum to 0.0)
+    totals = latest_car_data[["Car_Value", "Equity", "Loan_Balance"]].sum()
+    metrics["total_car_value"] = totals["Car_Value"]
+    metrics["total_equity"] = totals["Equity"]
+    metrics["total_loan_balance"] = totals["Loan_Balance"]
 
-    metrics["financed_count"] = len(
-        latest_car_data[latest_car_data["Loan_Status"] == CAR_LOAN_STATUSES["FINANCED"]]
-    )
-    metrics["owned_count"] = len(
-        latest_car_data[latest_car_data["Loan_Status"] == CAR_LOAN_STATUSES["OWNED"]]
-    )
+    # Count vehicles by status
+    status_counts = latest_car_data["Loan_Status"].value_counts()
+    metrics["financed_count"] = int(status_counts.get(CAR_LOAN_STATUSES["FINANCED"], 0))
+    metrics["owned_count"] = int(status_counts.get(CAR_LOAN_STATUSES["OWNED"], 0))
 
     # Get vehicle names for display
-    vehicle_names = latest_car_data["Asset"].tolist()
+    vehicle_names = latest_car_data["Asset"].to_numpy(dtype=object)
     metrics["vehicle_names_display"] = (
-        ", ".join(vehicle_names) if vehicle_names else "No vehicles"
+        ", ".join(vehicle_names) if vehicle_names.size else "No vehicles"
     )
 
     # Calculate YTD mileage using helper function
-    metrics["ytd_mileage"] = _calculate_ytd_mileage(car_assets_df)
+    metrics["ytd_mileage"] = _calculate_ytd_mileage(
+        car_assets_df,
+        current_year,
+        latest_readings=latest_car_data[["Asset", "Mileage"]],
+    )
 
     # Calculate latest total mileage
     if not car_assets_df.empty:
-        latest_mileage_data = car_assets_df.groupby("Asset")["Mileage"].max()
+        latest_mileage_data = car_assets_df.groupby("Asset", observed=True)[
+            "Mileage"
+        ].max()
         metrics["latest_mileage"] = latest_mileage_data.sum()
 
     return metrics
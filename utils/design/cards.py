@@ -1,6 +1,7 @@
 """Card components for the financial dashboard app."""
 
 import html
+from functools import lru_cache
 
 import streamlit as st
 
@@ -19,6 +20,28 @@ from .tokens import (  # Color tokens; Typography tokens; Spacing tokens; Border
     get_emphasis_card_title_styles,
 )
 
+# Static card styles do not depend on the card's arguments, so they are built
+# once at import time rather than on every render
+_CARD_BASE_STYLES = get_card_base_styles()
+_CARD_TITLE_STYLES = get_card_title_styles()
+_CARD_METRIC_STYLES = get_card_metric_styles(FONT_SIZE_4XL)
+_EMPHASIS_CARD_METRIC_STYLES = get_card_metric_styles(FONT_SIZE_5XL)
+_CARD_CAPTION_STYLES = get_card_caption_styles()
+_CARD_CHANGE_STYLES = get_card_change_styles()
+
+# Change indicator colors, keyed by color type (other types use the neutral color)
+_CHANGE_COLORS = {
+    color_type: get_change_color(color_type) for color_type in ("normal", "inverse")
+}
+_NEUTRAL_CHANGE_COLOR = get_change_color("neutral")
+
+
+@lru_cache(maxsize=1024)
+def _escape(text: str) -> str:
+    """Escape card text for HTML, reusing results for repeated titles and labels."""
+    return html.escape(text)
+
+
 # --- Card Components ---
 
 
@@ -32,19 +55,21 @@ def simple_card(title, metric, caption=None):
         caption (str, optional): Caption text below metric
     """
     # Ensure all inputs are strings and stripped, then escape HTML to prevent injection
-    title = html.escape(str(title).strip()) if title else ""
-    metric = html.escape(str(metric).strip()) if metric else ""
-    caption = html.escape(str(caption).strip()) if caption else ""
-
-    # Build HTML with conditional caption rendering
-    card_html = f"""
-    <div style="{get_card_base_styles()}">
-        <div style="{get_card_title_styles()}">{title}</div>
-        <div style="{get_card_metric_styles(FONT_SIZE_4XL)}">{metric}</div>
-        {f'<div style="{get_card_caption_styles()}">{caption}</div>' if caption else ''}
-    </div>
-    """
-    st.markdown(card_html.strip(), unsafe_allow_html=True)
+    title = _escape(str(title).strip()) if title else ""
+    metric = _escape(str(metric).strip()) if metric else ""
+    caption = _escape(str(caption).strip()) if caption else ""
+    caption_html = (
+        f'<div style="{_CARD_CAPTION_STYLES}">{caption}</div>' if caption else ""
+    )
+
+    # Build HTML (caption rendered only when present)
+    card_html = (
+        f'<div style="{_CARD_BASE_STYLES}">'
+        f'<div style="{_CARD_TITLE_STYLES}">{title}</div>'
+        f'<div style="{_CARD_METRIC_STYLES}">{metric}</div>'
+        f"{caption_html}</div>"
+    )
+    st.markdown(card_html, unsafe_allow_html=True)
 
 
 def emphasis_card(title, metric, caption=None, emphasis_color=BRAND_PRIMARY):
@@ -58,20 +83,22 @@ def emphasis_card(title, metric, caption=None, emphasis_color=BRAND_PRIMARY):
         emphasis_color (str): Color for emphasis styling
     """
     # Ensure all inputs are strings and stripped, then escape HTML to prevent injection
-    title = html.escape(str(title).strip()) if title else ""
-    metric = html.escape(str(metric).strip()) if metric else ""
-    caption = html.escape(str(caption).strip()) if caption else ""
-
-    # Build HTML with emphasis styling and conditional caption rendering
-    card_html = f"""
-    <div style="{get_emphasis_card_styles(emphasis_color)}">
-        <div style="{get_emphasis_accent_bar(emphasis_color)}"></div>
-        <div style="{get_emphasis_card_title_styles(emphasis_color)}">{title}</div>
-        <div style="{get_card_metric_styles(FONT_SIZE_5XL)}">{metric}</div>
-        {f'<div style="{get_card_caption_styles()}">{caption}</div>' if caption else ''}
-    </div>
-    """
-    st.markdown(card_html.strip(), unsafe_allow_html=True)
+    title = _escape(str(title).strip()) if title else ""
+    metric = _escape(str(metric).strip()) if metric else ""
+    caption = _escape(str(caption).strip()) if caption else ""
+    caption_html = (
+        f'<div style="{_CARD_CAPTION_STYLES}">{caption}</div>' if caption else ""
+    )
+
+    # Build HTML with emphasis styling (caption rendered only when present)
+    card_html = (
+        f'<div style="{get_emphasis_card_styles(emphasis_color)}">'
+        f'<div style="{get_emphasis_accent_bar(emphasis_color)}"></div>'
+        f'<div style="{get_emphasis_card_title_styles(emphasis_color)}">{title}</div>'
+        f'<div style="{_EMPHASIS_CARD_METRIC_STYLES}">{metric}</div>'
+        f"{caption_html}</div>"
+    )
+    st.markdown(card_html, unsafe_allow_html=True)
 
 
 def complex_card(
@@ -96,14 +123,14 @@ def complex_card(
         ytd_color (str): Color for YTD change ("normal", "inverse")
     """
     # Ensure all inputs are strings and stripped, then escape HTML to prevent injection
-    title = html.escape(str(title).strip()) if title else ""
-    metric = html.escape(str(metric).strip()) if metric else ""
+    title = _escape(str(title).strip()) if title else ""
+    metric = _escape(str(metric).strip()) if metric else ""
 
     # Handle caption
     caption_str = str(caption).strip() if caption is not None else ""
     if caption_str:
         caption_html = (
-            f'<div style="{get_card_caption_styles()}">{html.escape(caption_str)}</div>'
+            f'<div style="{_CARD_CAPTION_STYLES}">{_escape(caption_str)}</div>'
         )
     else:
         caption_html = ""
@@ -112,34 +139,32 @@ def complex_card(
     changes_parts = []
 
     if mom_change is not None:
-        mom_color_style = get_change_color(mom_color)
+        mom_color_style = _CHANGE_COLORS.get(mom_color, _NEUTRAL_CHANGE_COLOR)
         changes_parts.append(
-            f'<span style="color: {mom_color_style};">{html.escape(str(mom_change))}</span>'
+            f'<span style="color: {mom_color_style};">{_escape(str(mom_change))}</span>'
         )
 
     if ytd_change is not None:
-        ytd_color_style = get_change_color(ytd_color)
+        ytd_color_style = _CHANGE_COLORS.get(ytd_color, _NEUTRAL_CHANGE_COLOR)
         changes_parts.append(
-            f'<span style="color: {ytd_color_style};">{html.escape(str(ytd_change))}</span>'
+            f'<span style="color: {ytd_color_style};">{_escape(str(ytd_change))}</span>'
         )
 
     if changes_parts:
         changes_html = (
-            f'<div style="{get_card_change_styles()}">{" | ".join(changes_parts)}</div>'
+            f'<div style="{_CARD_CHANGE_STYLES}">{" | ".join(changes_parts)}</div>'
         )
     else:
         changes_html = ""
 
     # Build final card HTML
-    card_html = f"""
-    <div style="{get_card_base_styles()}">
-        <div style="{get_card_title_styles()}">{title}</div>
-        <div style="{get_card_metric_styles(FONT_SIZE_4XL)}">{metric}</div>
-        {changes_html}
-        {caption_html}
-    </div>
-    """
-    st.markdown(card_html.strip(), unsafe_allow_html=True)
+    card_html = (
+        f'<div style="{_CARD_BASE_STYLES}">'
+        f'<div style="{_CARD_TITLE_STYLES}">{title}</div>'
+        f'<div style="{_CARD_METRIC_STYLES}">{metric}</div>'
+        f"{changes_html}{caption_html}</div>"
+    )
+    st.markdown(card_html, unsafe_allow_html=True)
 
 
 def complex_emphasis_card(
@@ -166,14 +191,14 @@ def complex_emphasis_card(
         emphasis_color (str): Color for emphasis styling
     """
     # Ensure all inputs are strings and stripped, then escape HTML to prevent injection
-    title = html.escape(str(title).strip()) if title else ""
-    metric = html.escape(str(metric).strip()) if metric else ""
+    title = _escape(str(title).strip()) if title else ""
+    metric = _escape(str(metric).strip()) if metric else ""
 
     # Handle caption
     caption_str = str(caption).strip() if caption is not None else ""
     if caption_str:
         caption_html = (
-            f'<div style="{get_card_caption_styles()}">{html.escape(caption_str)}</div>'
+            f'<div style="{_CARD_CAPTION_STYLES}">{_escape(caption_str)}</div>'
         )
     else:
         caption_html = ""
@@ -182,32 +207,30 @@ def complex_emphasis_card(
     changes_parts = []
 
     if mom_change is not None:
-        mom_color_style = get_change_color(mom_color)
+        mom_color_style = _CHANGE_COLORS.get(mom_color, _NEUTRAL_CHANGE_COLOR)
         changes_parts.append(
-            f'<span style="color: {mom_color_style};">{html.escape(str(mom_change))}</span>'
+            f'<span style="color: {mom_color_style};">{_escape(str(mom_change))}</span>'
         )
 
     if ytd_change is not None:
-        ytd_color_style = get_change_color(ytd_color)
+        ytd_color_style = _CHANGE_COLORS.get(ytd_color, _NEUTRAL_CHANGE_COLOR)
         changes_parts.append(
-            f'<span style="color: {ytd_color_style};">{html.escape(str(ytd_change))}</span>'
+            f'<span style="color: {ytd_color_style};">{_escape(str(ytd_change))}</span>'
         )
 
     if changes_parts:
         changes_html = (
-            f'<div style="{get_card_change_styles()}">{" | ".join(changes_parts)}</div>'
+            f'<div style="{_CARD_CHANGE_STYLES}">{" | ".join(changes_parts)}</div>'
         )
     else:
         changes_html = ""
 
     # Build final card HTML with emphasis styling
-    card_html = f"""
-    <div style="{get_emphasis_card_styles(emphasis_color)}">
-        <div style="{get_emphasis_accent_bar(emphasis_color)}"></div>
-        <div style="{get_emphasis_card_title_styles(emphasis_color)}">{title}</div>
-        <div style="{get_card_metric_styles(FONT_SIZE_5XL)}">{metric}</div>
-        {changes_html}
-        {caption_html}
-    </div>
-    """
-    st.markdown(card_html.strip(), unsafe_allow_html=True)
+    card_html = (
+        f'<div style="{get_emphasis_card_styles(emphasis_color)}">'
+        f'<div style="{get_emphasis_accent_bar(emphasis_color)}"></div>'
+        f'<div style="{get_emphasis_card_title_styles(emphasis_color)}">{title}</div>'
+        f'<div style="{_EMPHASIS_CARD_METRIC_STYLES}">{metric}</div>'
+        f"{changes_html}{caption_html}</div>"
+    )
+    st.markdown(card_html, unsafe_allow_html=True)
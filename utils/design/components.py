@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
@@ -17,13 +18,8 @@ def create_metric_grid(metrics_list, cols=4):
     columns = st.columns(cols)
     for i, metric in enumerate(metrics_list):
         with columns[i % cols]:
-            # Add container with consistent height for better alignment
-            st.markdown(
-                '<div style="height: 100%; display: flex; flex-direction: column;">',
-                unsafe_allow_html=True,
-            )
+            # Each card renders as a single markdown element
             metric()
-            st.markdown("</div>", unsafe_allow_html=True)
 
 
 def create_chart_grid(charts_list, cols=2):
@@ -185,13 +181,17 @@ def create_summary_statistics(df, latest_month, display_date_format="%B %Y"):
         latest_month: Latest month datetime or period object
         display_date_format (str): Date format string for displaying dates
     """
+    from utils import calculate_summary_statistics
+
     from .cards import simple_card
 
-    # Calculate summary statistics
-    total_platforms = df["Platform"].nunique()
-    total_assets = df["Asset"].nunique() if "Asset" in df.columns else 0
-    months_tracked = df["Timestamp"].dt.to_period("M").nunique()
-    latest_records = len(df[df["Timestamp"].dt.to_period("M") == latest_month])
+    # Calculate summary statistics (cached across reruns)
+    if isinstance(latest_month, pd.Period):
+        latest_month = latest_month.to_timestamp()
+    latest_month = pd.Timestamp(latest_month)
+    total_platforms, total_assets, months_tracked, latest_records = (
+        calculate_summary_statistics(df, latest_month)
+    )
 
     # Create section header
     create_section_header("Summary Statistics", icon="📊")
@@ -331,7 +331,12 @@ def create_portfolio_analytics_charts(
             # For specific asset type, show platform allocation
             from utils import get_asset_breakdown
 
-            platform_breakdown = get_asset_breakdown(filtered_df, "platform")
+            latest_month = (
+                monthly_totals["Month"].iloc[-1] if not monthly_totals.empty else None
+            )
+            platform_breakdown = get_asset_breakdown(
+                filtered_df, "platform", latest_month=latest_month
+            )
             if not platform_breakdown.empty:
                 from utils.charts import create_pie_chart
 
@@ -420,6 +425,7 @@ def create_vehicle_analytics_charts(car_assets_df, car_expenses_df, car_payments
     from utils import (
         calculate_car_monthly_costs,
         get_car_equity_trends,
+        get_monthly_aggregation,
     )
     from utils.charts import (
         create_bar_chart,
@@ -522,15 +528,9 @@ def create_vehicle_analytics_charts(car_assets_df, car_expenses_df, car_payments
         st.markdown("**Monthly Net Mileage**")
         if not car_assets_df.empty:
             # Calculate monthly net mileage (difference from previous month)
-            monthly_mileage = (
-                car_assets_df.groupby(car_assets_df["Timestamp"].dt.to_period("M"))[
-                    "Mileage"
-                ]
-                .sum()
-                .reset_index()
+            monthly_mileage = get_monthly_aggregation(
+                car_assets_df, value_col="Mileage"
             )
-            monthly_mileage["Month"] = monthly_mileage["Timestamp"].dt.to_timestamp()
-            monthly_mileage = monthly_mileage.sort_values("Month")
 
             # Calculate net mileage (difference from previous month)
             monthly_mileage["Net_Mileage"] = monthly_mileage["Mileage"].diff()
@@ -579,6 +579,7 @@ def create_investment_asset_analysis(df, asset_type=None):
 
     from utils import (
         filter_by_asset_type,
+        get_monthly_aggregation,
     )
     from utils.charts import (
         create_bar_chart,
@@ -598,74 +599,70 @@ def create_investment_asset_analysis(df, asset_type=None):
         return
 
     # Prepare monthly data by asset
-    investment_df["Month"] = investment_df["Timestamp"].dt.to_period("M")
-    monthly_by_asset = (
-        investment_df.groupby(["Month", "Asset"])["Value"].sum().reset_index()
-    )
-    monthly_by_asset["Month"] = monthly_by_asset["Month"].dt.to_timestamp()
+    monthly_by_asset = get_monthly_aggregation(investment_df, ["Asset"])
 
     if monthly_by_asset.empty:
         st.info("No monthly asset data available")
         return
 
+    # Month-over-month returns per asset, computed once for the returns, MoM and
+    # distribution charts (rows grouped by asset in order of first appearance,
+    # months ascending within each asset; each asset's first month is dropped)
+    asset_groups = monthly_by_asset.groupby("Asset", observed=True, sort=False)
+    asset_returns = (
+        monthly_by_asset.assign(
+            Asset=monthly_by_asset["Asset"].astype(str),
+            Return=asset_groups["Value"].pct_change(),
+        )
+        .loc[asset_groups.ngroup().sort_values(kind="stable").index]
+        .dropna(subset=["Return"])
+    )
+
     # 1. Percentage Returns Over Time
     def create_asset_returns_time_series():
         st.markdown("**Percentage Returns Over Time**")
 
-        # Calculate percentage returns for each asset over time
-        returns_data = []
-        for asset in monthly_by_asset["Asset"].unique():
-            asset_data = monthly_by_asset[
-                monthly_by_asset["Asset"] == asset
-            ].sort_values("Month")
-            asset_data["Return"] = asset_data["Value"].pct_change()
-            asset_data["Asset"] = asset
-            returns_data.append(asset_data[["Month", "Asset", "Return"]])
-
-        if returns_data:
-            returns_df = pd.concat(returns_data, ignore_index=True)
-            returns_clean = returns_df.dropna()
-
-            if not returns_clean.empty:
-                # Pivot to get assets as columns
-                returns_pivot = returns_clean.pivot(
-                    index="Month", columns="Asset", values="Return"
-                )
-                returns_pivot = returns_pivot.reset_index()
+        if not asset_returns.empty:
+            # Pivot to get assets as columns
+            returns_pivot = asset_returns.pivot(
+                index="Month", columns="Asset", values="Return"
+            )
+            returns_pivot = returns_pivot.reset_index()
 
-                # Get asset columns (excluding Month)
-                asset_cols = [col for col in returns_pivot.columns if col != "Month"]
+            # Get asset columns (excluding Month)
+            asset_cols = [col for col in returns_pivot.columns if col != "Month"]
 
-                fig_returns = create_time_series_chart(
-                    returns_pivot,
-                    x_col="Month",
-                    y_cols=asset_cols,
-                    x_label=get_chart_label("month"),
-                    y_label="Percentage Return",
-                    y_format="percentage",
-                )
-                st.plotly_chart(fig_returns, use_container_width=True)
-            else:
-                st.info("Not enough data for returns analysis")
+            fig_returns = create_time_series_chart(
+                returns_pivot,
+                x_col="Month",
+                y_cols=asset_cols,
+                x_label=get_chart_label("month"),
+                y_label="Percentage Return",
+                y_format="percentage",
+            )
+            st.plotly_chart(fig_returns, use_container_width=True)
         else:
-            st.info("No returns data available")
+            st.info("Not enough data for returns analysis")
 
     # 2. Asset Allocation Over Time (Percentage)
     def create_asset_allocation_time_series():
         st.markdown("**Asset Allocation Over Time**")
 
-        # Calculate percentage allocation for each asset over time
-        allocation_data = []
-        for month in monthly_by_asset["Month"].unique():
-            month_data = monthly_by_asset[monthly_by_asset["Month"] == month]
-            total_value = month_data["Value"].sum()
-            month_allocation = {"Month": month}
-            for asset in month_data["Asset"].unique():
-                asset_value = month_data[month_data["Asset"] == asset]["Value"].iloc[0]
-                allocation_pct = (asset_value / total_value) if total_value > 0 else 0
-                month_allocation[asset] = allocation_pct
-            allocation_data.append(month_allocation)
-        allocation_df = pd.DataFrame(allocation_data)
+        # Calculate percentage allocation for each asset over time (assets absent
+        # from a month stay NaN; months with a non-positive total are 0)
+        asset_values = (
+            monthly_by_asset.set_index(["Month", "Asset"])["Value"]
+            .unstack("Asset")
+            .reindex(columns=pd.unique(monthly_by_asset["Asset"]))
+        )
+        totals = asset_values.sum(axis=1)
+        allocation_df = asset_values.div(totals.where(totals > 0), axis=0)
+        allocation_df = allocation_df.mask(
+            asset_values.notna() & allocation_df.isna(), 0.0
+        )
+        allocation_df = allocation_df.rename_axis(
+            index="Month", columns=None
+        ).reset_index()
         if not allocation_df.empty:
             asset_cols = [col for col in allocation_df.columns if col != "Month"]
             fig_allocation = create_time_series_chart(
@@ -684,75 +681,44 @@ def create_investment_asset_analysis(df, asset_type=None):
     def create_mom_changes_chart():
         st.markdown("**Month-over-Month Changes by Asset**")
 
-        mom_data = []
-        for asset in monthly_by_asset["Asset"].unique():
-            asset_data = monthly_by_asset[
-                monthly_by_asset["Asset"] == asset
-            ].sort_values("Month")
-            asset_data["MoM"] = asset_data["Value"].pct_change()
-            asset_data["Asset"] = asset
-            mom_data.append(asset_data[["Month", "Asset", "MoM"]])
-
-        if mom_data:
-            mom_df = pd.concat(mom_data, ignore_index=True)
-            mom_clean = mom_df.dropna()
-
-            if not mom_clean.empty:
-                mom_pivot = (
-                    mom_clean.pivot(index="Month", columns="Asset", values="MoM")
-                    .reset_index()
-                    .fillna(0)
-                )
-                asset_cols = [col for col in mom_pivot.columns if col != "Month"]
+        if not asset_returns.empty:
+            mom_pivot = (
+                asset_returns.pivot(index="Month", columns="Asset", values="Return")
+                .reset_index()
+                .fillna(0)
+            )
+            asset_cols = [col for col in mom_pivot.columns if col != "Month"]
 
-                if asset_cols:
-                    fig_mom = create_bar_chart(
-                        mom_pivot,
-                        x_col="Month",
-                        y_cols=asset_cols,
-                        x_label=get_chart_label("month"),
-                        y_label=get_chart_label("percentage_change"),
-                        y_format="percentage",
-                    )
-                    st.plotly_chart(fig_mom, use_container_width=True)
-                else:
-                    st.info("No asset data available for MoM analysis")
+            if asset_cols:
+                fig_mom = create_bar_chart(
+                    mom_pivot,
+                    x_col="Month",
+                    y_cols=asset_cols,
+                    x_label=get_chart_label("month"),
+                    y_label=get_chart_label("percentage_change"),
+                    y_format="percentage",
+                )
+                st.plotly_chart(fig_mom, use_container_width=True)
             else:
-                st.info("Not enough data for MoM analysis")
+                st.info("No asset data available for MoM analysis")
         else:
-            st.info("No MoM data available")
+            st.info("Not enough data for MoM analysis")
 
     # 3. Returns Distribution Box Plot
     def create_returns_boxplot():
         st.markdown("**Returns Distribution by Asset**")
 
-        # Calculate returns for each asset
-        returns_data = []
-        for asset in monthly_by_asset["Asset"].unique():
-            asset_data = monthly_by_asset[
-                monthly_by_asset["Asset"] == asset
-            ].sort_values("Month")
-            asset_data["Return"] = asset_data["Value"].pct_change()
-            asset_data["Asset"] = asset
-            returns_data.append(asset_data[["Asset", "Return"]])
-
-        if returns_data:
-            returns_df = pd.concat(returns_data, ignore_index=True)
-            returns_clean = returns_df.dropna()
-
-            if not returns_clean.empty:
-                fig_box = create_box_plot(
-                    returns_clean,
-                    y_cols="Return",
-                    color_col="Asset",
-                    y_label=get_chart_label("percentage_change"),
-                    y_format="percentage",
-                )
-                st.plotly_chart(fig_box, use_container_width=True)
-            else:
-                st.info("Not enough data for returns analysis")
+        if not asset_returns.empty:
+            fig_box = create_box_plot(
+                asset_returns[["Asset", "Return"]],
+                y_cols="Return",
+                color_col="Asset",
+                y_label=get_chart_label("percentage_change"),
+                y_format="percentage",
+            )
+            st.plotly_chart(fig_box, use_container_width=True)
         else:
-            st.info("No returns data available")
+            st.info("Not enough data for returns analysis")
 
     # Create charts in 2x2 grid layout
     create_chart_grid(
@@ -777,6 +743,7 @@ def create_pension_asset_analysis(df, cashflows_df=None, asset_type=None):
         calculate_actual_pension_returns,
         filter_by_asset_type,
         get_cumulative_pension_cashflows,
+        get_monthly_aggregation,
     )
     from utils.charts import (
         create_bar_chart,
@@ -796,11 +763,7 @@ def create_pension_asset_analysis(df, cashflows_df=None, asset_type=None):
         return
 
     # Prepare monthly data by asset
-    pension_df["Month"] = pension_df["Timestamp"].dt.to_period("M")
-    monthly_by_asset = (
-        pension_df.groupby(["Month", "Asset"])["Value"].sum().reset_index()
-    )
-    monthly_by_asset["Month"] = monthly_by_asset["Month"].dt.to_timestamp()
+    monthly_by_asset = get_monthly_aggregation(pension_df, ["Asset"])
 
     if monthly_by_asset.empty:
         st.info("No monthly pension data available")
@@ -952,7 +915,7 @@ def create_pension_forecast_section(
     Args:
         pension_df (pd.DataFrame): DataFrame containing the historical pension values.
     """
-    from utils import forecast_pension_growth
+    from utils import forecast_pension_growth, get_monthly_aggregation
     from utils.charts import create_time_series_chart
 
     create_section_header("Pension Growth Forecast", icon="🔮")
@@ -977,22 +940,23 @@ def create_pension_forecast_section(
                 "Future Monthly Contribution (£)", min_value=0, value=500, step=50
             )
 
+        # The forecast is cached per seed, so a new seed draws a new sample
+        rerun_simulation = st.button("Re-run Simulation")
+        if rerun_simulation or "pension_forecast_seed" not in st.session_state:
+            st.session_state["pension_forecast_seed"] = int(
+                np.random.default_rng().integers(2**32)
+            )
+
     # --- 2. Run Forecast ---
     # Prepare historical data for forecasting function
-    historical_agg = (
-        pension_df.groupby(pension_df["Timestamp"].dt.to_period("M").dt.to_timestamp())[
-            "Value"
-        ]
-        .sum()
-        .reset_index()
-    )
-    historical_agg.rename(columns={"Timestamp": "Month"}, inplace=True)
+    historical_agg = get_monthly_aggregation(pension_df)
 
     projection_df = forecast_pension_growth(
         historical_df=historical_agg,
         forecast_years=forecast_years,
         monthly_contribution=monthly_contribution,
         annual_return_rate=annual_return / 100,
+        seed=st.session_state["pension_forecast_seed"],
     )
 
     if projection_df.empty:
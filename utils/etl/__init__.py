@@ -1,11 +1,21 @@
 """Enhanced ETL module for financial data processing."""
 
 from .asset_classifier import classify_asset_types
-from .data_loader import filter_data_by_date_range, get_month_range, load_data
+from .data_loader import (
+    LoadedData,
+    filter_data_by_date_range,
+    filter_mask_by_date_range,
+    get_month_range,
+    load_data,
+    load_data_with_month_range,
+)
 
 __all__ = [
     "load_data",
+    "load_data_with_month_range",
+    "LoadedData",
     "filter_data_by_date_range",
+    "filter_mask_by_date_range",
     "get_month_range",
     "classify_asset_types",
 ]
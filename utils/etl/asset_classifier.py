@@ -59,16 +59,20 @@ def get_asset_type_summary(df):
     asset_type_counts = df["Asset_Type"].value_counts()
 
     # Value by asset type
-    asset_type_values = df.groupby("Asset_Type")["Value"].sum()
+    asset_type_values = df.groupby("Asset_Type", observed=True)["Value"].sum()
 
     # Platform distribution by asset type
     platform_distribution = (
-        df.groupby(["Asset_Type", "Platform"])["Value"].sum().unstack(fill_value=0)
+        df.groupby(["Asset_Type", "Platform"], observed=True)["Value"]
+        .sum()
+        .unstack(fill_value=0)
     )
 
     # Asset distribution by asset type
     asset_distribution = (
-        df.groupby(["Asset_Type", "Asset"])["Value"].sum().unstack(fill_value=0)
+        df.groupby(["Asset_Type", "Asset"], observed=True)["Value"]
+        .sum()
+        .unstack(fill_value=0)
     )
 
     summary = {
@@ -1,7 +1,9 @@
 """Data loading and preprocessing functions for the financial dashboard app."""
 
 import os
+from typing import List, NamedTuple, Optional
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -14,6 +16,7 @@ from ..config import (
     CAR_EXPENSES_VALID_VALUES,
     CAR_PAYMENTS_CONFIG,
     CAR_PAYMENTS_VALID_VALUES,
+    DISPLAY_DATE_FORMAT,
     PENSION_CASHFLOWS_CONFIG,
     PENSION_CASHFLOWS_VALID_VALUES,
 )
@@ -30,6 +33,15 @@ except ImportError:
     GOOGLE_SHEETS_AVAILABLE = False
 
 
+class LoadedData(NamedTuple):
+    """Balance Sheet data bundled with its precomputed month range."""
+
+    df: Optional[pd.DataFrame]
+    month_options: List[str]
+    min_month: Optional[pd.Timestamp]
+    max_month: Optional[pd.Timestamp]
+
+
 def _connect_to_google_sheets():
     """Establish connection to Google Sheets and return the client."""
     if not GOOGLE_SHEETS_AVAILABLE:
@@ -139,7 +151,7 @@ def _clean_and_process_data(df, config, validation_config=None):
                 .str.replace(",", "")
                 .str.strip()
             )
-            df[col] = pd.to_numeric(df[col], errors="coerce")
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype("float64")
 
     for col in config["numeric_columns"]:
         if col in df.columns:
@@ -163,6 +175,12 @@ def _clean_and_process_data(df, config, validation_config=None):
         )
         return None
 
+    # Attach the reporting month (as a month-start timestamp) once so
+    # downstream processing can reuse it
+    if "Timestamp" in df.columns:
+        months = df["Timestamp"].values.astype("datetime64[M]")
+        df = df.assign(Month=months.astype("datetime64[ns]"))
+
     return df
 
 
@@ -192,18 +210,21 @@ def load_data():
         if "Asset_Type" not in df.columns:
             df = classify_asset_types(df)
 
-        month_period = df["Timestamp"].dt.to_period("M")
-        monthly_asset_counts = df.groupby([month_period, "Asset"]).size()
+        monthly_asset_counts = df.groupby(["Month", "Asset"]).size()
         if (monthly_asset_counts > 1).any():
             st.info("Using latest entry for duplicate assets per month.")
-            df = df.assign(Month=month_period)
             df = (
                 df.sort_values("Timestamp")
                 .groupby(["Month", "Asset"])
                 .last()
                 .reset_index()
             )
-            df = df.drop(columns=["Month"])
+
+        # Repeated labels are stored as categories so that equality filters and
+        # groupbys compare integer codes rather than strings
+        df = df.astype(
+            {column: "category" for column in ["Asset_Type", "Platform", "Asset"]}
+        )
 
         return df
     except Exception as e:
@@ -211,6 +232,28 @@ def load_data():
         return None
 
 
+@st.cache_data
+def load_data_with_month_range():
+    """
+    Load the Balance Sheet data together with its month range.
+
+    The month options and bounds are computed once alongside the data so that a
+    single cache hit serves both on every Streamlit rerun.
+
+    Returns:
+        LoadedData: The DataFrame, display labels for each month with data, and
+        the first and last month (as month-start timestamps).
+    """
+    df = load_data()
+    if df is None or df.empty:
+        return LoadedData(df, [], None, None)
+
+    months = pd.DatetimeIndex(np.unique(df["Timestamp"].values.astype("datetime64[M]")))
+    month_options = months.strftime(DISPLAY_DATE_FORMAT).tolist()
+
+    return LoadedData(df, month_options, months[0], months[-1])
+
+
 @st.cache_data
 def load_pension_cashflows():
     """Load and preprocess pension cashflow data."""
@@ -222,7 +265,13 @@ def load_pension_cashflows():
 @st.cache_data
 def load_car_assets():
     """Load and preprocess car assets data."""
-    return _load_and_process_sheet(CAR_ASSETS_CONFIG, CAR_ASSETS_VALID_VALUES)
+    df = _load_and_process_sheet(CAR_ASSETS_CONFIG, CAR_ASSETS_VALID_VALUES)
+    if df is None:
+        return None
+
+    # Vehicles and loan statuses are grouped and compared repeatedly, so store
+    # them as categories
+    return df.astype({"Asset": "category", "Loan_Status": "category"})
 
 
 @st.cache_data
@@ -237,20 +286,33 @@ def load_car_expenses():
     return _load_and_process_sheet(CAR_EXPENSES_CONFIG, CAR_EXPENSES_VALID_VALUES)
 
 
-def filter_data_by_date_range(df, start_date=None, end_date=None):
-    """Filter data by date range."""
+def filter_mask_by_date_range(df, start_date=None, end_date=None):
+    """
+    Build a boolean mask selecting rows within a date range.
+
+    Aggregating callers can use the mask directly (e.g. ``df.loc[mask].groupby(...)``)
+    instead of materializing an intermediate filtered DataFrame.
+    """
     if df is None:
         return None
 
-    filtered_df = df.copy()
+    mask = pd.Series(True, index=df.index)
 
     if start_date:
-        filtered_df = filtered_df[filtered_df["Timestamp"] >= start_date]
+        mask &= df["Timestamp"] >= start_date
 
     if end_date:
-        filtered_df = filtered_df[filtered_df["Timestamp"] <= end_date]
+        mask &= df["Timestamp"] <= end_date
 
-    return filtered_df
+    return mask
+
+
+def filter_data_by_date_range(df, start_date=None, end_date=None):
+    """Filter data by date range."""
+    if df is None:
+        return None
+
+    return df.loc[filter_mask_by_date_range(df, start_date, end_date)]
 
 
 def get_month_range(df):
@@ -258,9 +320,12 @@ def get_month_range(df):
     if df is None or df.empty:
         return None, None
 
-    df["Timestamp"] = pd.to_datetime(df["Timestamp"])
-    min_date = df["Timestamp"].min()
-    max_date = df["Timestamp"].max()
+    timestamps = df["Timestamp"]
+    if not pd.api.types.is_datetime64_any_dtype(timestamps):
+        timestamps = pd.to_datetime(timestamps)
+
+    min_date = timestamps.min()
+    max_date = timestamps.max()
 
     return min_date, max_date
 